@@ -0,0 +1,12 @@
+"""The rich console shared by the command modules."""
+
+# rich is imported on first use so importing the command modules stays cheap
+_console = None
+
+def get_console():
+    """Return the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
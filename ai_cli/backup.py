@@ -1,43 +1,257 @@
 import os
+import mmap
 import shutil
 import zipfile
 import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich.progress import Progress
-from .config import GLOBAL_CONFIG_DIR, PROJECT_CONFIG_DIR_NAME, RESOURCE_DIRS
+from ._console import get_console
+from .config import config, GLOBAL_CONFIG_DIR, PROJECT_CONFIG_DIR_NAME, RESOURCE_DIRS
 
-console = Console()
+# Number of files read ahead of the compressor
+_READ_AHEAD = 32
 
-def create_backup(resource_type: str = None):
+# Buffer size used when streaming members out of an archive
+_COPY_BUFSIZE = 1 << 20
+
+# DEFLATE level for ZIP backups; level 3 keeps most of the default ratio at
+# several times the speed
+_ZIP_COMPRESSLEVEL = 3
+
+# Suffix of zstd-compressed tar backups
+_ZSTD_SUFFIX = ".tar.zst"
+
+# Files at least this large are memory-mapped instead of read into a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+def _read_entry(file_path: str, arcname: str):
+    """Stat and read a file for the archive (runs on a worker thread).
+    
+    Large files are returned as a read-only mmap so their contents are handed
+    to the compressor without first being copied into a bytes object.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    with open(file_path, 'rb') as f:
+        if zinfo.file_size >= _MMAP_THRESHOLD:
+            return zinfo, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return zinfo, f.read()
+
+def _write_entry(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data) -> None:
+    """Add a file to the archive, compressing it in a single call.
+    
+    ``ZipFile.write`` feeds the compressor in small chunks; resource files are
+    small enough to read whole, which lets zlib compress each one in one pass.
+    """
+    try:
+        zipf.writestr(
+            zinfo,
+            data,
+            compress_type=zipf.compression,
+            compresslevel=zipf.compresslevel
+        )
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def _walk_files(directory):
+    """Yield the path of every file below ``directory`` as a string.
+    
+    Uses ``os.scandir`` with an explicit stack so file types come from the
+    directory entries themselves instead of an extra ``stat`` per entry.
+    Symlinked directories are not descended into, matching ``os.walk``.
+    """
+    stack = deque([directory])
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+def _iter_files(resource_dirs):
+    """Yield ``(file_path, arcname)`` for every file in the given resource directories."""
+    # Every walked path starts with the config directory, so the arcname is
+    # just the remainder of the string
+    prefix_len = len(os.path.join(str(GLOBAL_CONFIG_DIR), ''))
+    for rt, resource_dir in resource_dirs:
+        if resource_dir.exists():
+            for file_path in _walk_files(str(resource_dir)):
+                yield file_path, file_path[prefix_len:]
+
+def _member_parts(name: str):
+    """Split an archive member name into safe path components.
+    
+    Mirrors ``ZipFile.extractall``: leading slashes and '.' are dropped, and
+    names that try to escape the target directory are rejected.
+    """
+    parts = [part for part in name.split('/') if part not in ('', '.')]
+    if '..' in parts:
+        raise ValueError(f"Unsafe path in backup: {name}")
+    return parts
+
+def _is_resource_member(parts, is_dir: bool) -> bool:
+    """Whether a member lies inside a top-level resource directory (e.g. 'rules/')."""
+    return bool(parts) and parts[0].endswith('s') and (len(parts) > 1 or is_dir)
+
+def _zip_entries(zipf: zipfile.ZipFile):
+    """Yield ``(parts, src)`` for resource members of a ZIP backup.
+    
+    ``src`` is an open file object for regular files and None for directories.
+    """
+    for info in zipf.infolist():
+        parts = _member_parts(info.filename)
+        if not _is_resource_member(parts, info.is_dir()):
+            continue
+        if info.is_dir():
+            yield parts, None
+        else:
+            with zipf.open(info) as src:
+                yield parts, src
+
+def _tar_entries(tar):
+    """Yield ``(parts, src)`` for resource members of a streamed tar backup.
+    
+    Only regular files and directories are restored; links and special
+    files are skipped.
+    """
+    for member in tar:
+        if not (member.isfile() or member.isdir()):
+            continue
+        parts = _member_parts(member.name)
+        if not _is_resource_member(parts, member.isdir()):
+            continue
+        yield parts, (None if member.isdir() else tar.extractfile(member))
+
+def _extract_member(src, target: Path) -> None:
+    """Stream a single archive member to ``target`` (a directory if ``src`` is None)."""
+    if src is None:
+        target.mkdir(parents=True, exist_ok=True)
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+def _restore_entries(entries) -> int:
+    """Extract archive entries below the config directory.
+    
+    Each resource directory is moved aside (a rename, no data is copied) the
+    first time one of its members is seen, then members are extracted
+    straight into place. On failure the previous directories are put back.
+    
+    Returns:
+        The number of resource directories restored.
+    """
+    restored = []
+    stash = {}
+    try:
+        for parts, src in entries:
+            if parts[0] not in restored:
+                restored.append(parts[0])
+                target_dir = GLOBAL_CONFIG_DIR / parts[0]
+                if target_dir.exists():
+                    old_dir = target_dir.with_name(f".{parts[0]}.restore-old")
+                    if old_dir.exists():
+                        shutil.rmtree(old_dir)
+                    os.replace(target_dir, old_dir)
+                    stash[target_dir] = old_dir
+            _extract_member(src, GLOBAL_CONFIG_DIR.joinpath(*parts))
+    except BaseException:
+        # Put the previous directories back
+        for name in restored:
+            target_dir = GLOBAL_CONFIG_DIR / name
+            if target_dir.exists():
+                shutil.rmtree(target_dir)
+            if target_dir in stash:
+                os.replace(stash[target_dir], target_dir)
+        raise
+    
+    for old_dir in stash.values():
+        shutil.rmtree(old_dir)
+    return len(restored)
+
+def _write_zip(backup_file: Path, resource_dirs) -> None:
+    """Write a DEFLATE-compressed ZIP backup."""
+    # Reads happen on worker threads while this thread compresses and
+    # writes entries in order; the window bounds how much is held in memory.
+    with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED,
+                         allowZip64=False, compresslevel=_ZIP_COMPRESSLEVEL) as zipf, \
+            ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pending = deque()
+        for file_path, arcname in _iter_files(resource_dirs):
+            pending.append(executor.submit(_read_entry, file_path, arcname))
+            if len(pending) >= _READ_AHEAD:
+                _write_entry(zipf, *pending.popleft().result())
+        while pending:
+            _write_entry(zipf, *pending.popleft().result())
+
+def _write_tar_zst(backup_file: Path, resource_dirs, zstd) -> None:
+    """Write a zstd-compressed tar backup, compressing on all cores."""
+    import tarfile
+    cctx = zstd.ZstdCompressor(level=3, threads=-1)
+    with open(backup_file, 'wb') as raw, cctx.stream_writer(raw) as zw, \
+            tarfile.open(fileobj=zw, mode='w|') as tar:
+        for file_path, arcname in _iter_files(resource_dirs):
+            with open(file_path, 'rb') as f:
+                tar.addfile(tar.gettarinfo(arcname=arcname, fileobj=f), f)
+
+def _scan_backups(backup_dir: Path):
+    """Return directory entries for the ZIP and zstd backups in ``backup_dir``.
+    
+    ``DirEntry.stat()`` caches its result, so callers can sort and display
+    the entries without another ``stat`` per file.
+    """
+    try:
+        with os.scandir(backup_dir) as it:
+            return [entry for entry in it
+                    if entry.name.endswith(('.zip', _ZSTD_SUFFIX)) and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+def create_backup(resource_type: str = None, compression: str = None):
     """
     Create a backup of the specified resource type or all resources if none specified.
     
     Args:
         resource_type: Type of resource to backup (e.g., 'rule', 'workflow'). If None, backs up all resources.
+        compression: 'zip' (the default) for a ZIP archive, or 'zstd' for a
+            zstd-compressed tar, which is much faster to write and needs the
+            optional zstandard package. If None, the 'backup_compression'
+            config key is used.
     """
+    console = get_console()
+    if compression is None:
+        compression = config.get("backup_compression", "zip")
+    if compression not in ("zip", "zstd"):
+        console.print(f"[red]Unknown backup compression '{compression}'; use 'zip' or 'zstd'.[/red]")
+        return None
+    zstd = None
+    if compression == "zstd":
+        try:
+            import zstandard as zstd
+        except ImportError:
+            console.print("[red]zstd backups need the zstandard package: pip install 'ai-cli[zstd]'[/red]")
+            return None
+    
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_dir = GLOBAL_CONFIG_DIR / "backups"
     backup_dir.mkdir(parents=True, exist_ok=True)
+    suffix = _ZSTD_SUFFIX if zstd else ".zip"
     
     if resource_type:
-        backup_file = backup_dir / f"{resource_type}_{timestamp}.zip"
+        backup_file = backup_dir / f"{resource_type}_{timestamp}{suffix}"
         resource_dirs = [(resource_type, GLOBAL_CONFIG_DIR / f"{resource_type}s")]
     else:
-        backup_file = backup_dir / f"ai_cli_backup_{timestamp}.zip"
-        resource_dirs = [(rt, GLOBAL_CONFIG_DIR / f"{rt}s") for rt in RESOURCE_DIRS]
+        backup_file = backup_dir / f"ai_cli_backup_{timestamp}{suffix}"
+        # RESOURCE_DIRS already holds the plural directory names
+        resource_dirs = [(rd[:-1], GLOBAL_CONFIG_DIR / rd) for rd in RESOURCE_DIRS]
     
     try:
-        with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for rt, resource_dir in resource_dirs:
-                if resource_dir.exists():
-                    for root, _, files in os.walk(resource_dir):
-                        for file in files:
-                            file_path = Path(root) / file
-                            arcname = file_path.relative_to(GLOBAL_CONFIG_DIR)
-                            zipf.write(file_path, arcname)
+        if zstd:
+            _write_tar_zst(backup_file, resource_dirs, zstd)
+        else:
+            _write_zip(backup_file, resource_dirs)
         
         console.print(f"[green]Backup created successfully: {backup_file}[/green]")
         return str(backup_file)
@@ -52,8 +266,11 @@ def restore_backup(backup_path: str = None):
     Args:
         backup_path: Path to the backup file. If None, prompts user to select from available backups.
     """
+    from rich.prompt import Prompt, Confirm
+    console = get_console()
+    
     if not backup_path:
-        backups = list(GLOBAL_CONFIG_DIR.glob("backups/*.zip"))
+        backups = [Path(entry.path) for entry in _scan_backups(GLOBAL_CONFIG_DIR / "backups")]
         if not backups:
             console.print("[yellow]No backup files found.[/yellow]")
             return False
@@ -75,33 +292,16 @@ def restore_backup(backup_path: str = None):
         return False
     
     try:
-        # Create a temporary directory for extraction
-        temp_dir = GLOBAL_CONFIG_DIR / "temp_restore"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        temp_dir.mkdir()
-        
-        # Extract the backup
-        with zipfile.ZipFile(backup_path, 'r') as zipf:
-            zipf.extractall(temp_dir)
-        
-        # Restore each resource type
-        restored = 0
-        for item in temp_dir.iterdir():
-            if item.is_dir() and item.name.endswith('s'):  # e.g., 'rules', 'workflows'
-                resource_type = item.name[:-1]  # Remove 's' to get singular form
-                target_dir = GLOBAL_CONFIG_DIR / item.name
-                
-                # Remove existing directory if it exists
-                if target_dir.exists():
-                    shutil.rmtree(target_dir)
-                
-                # Copy the restored files
-                shutil.copytree(item, target_dir)
-                restored += 1
-        
-        # Clean up
-        shutil.rmtree(temp_dir)
+        if backup_path.name.endswith(_ZSTD_SUFFIX):
+            import tarfile
+            import zstandard as zstd
+            with open(backup_path, 'rb') as raw, \
+                    zstd.ZstdDecompressor().stream_reader(raw) as zr, \
+                    tarfile.open(fileobj=zr, mode='r|') as tar:
+                restored = _restore_entries(_tar_entries(tar))
+        else:
+            with zipfile.ZipFile(backup_path, 'r') as zipf:
+                restored = _restore_entries(_zip_entries(zipf))
         
         if restored > 0:
             console.print(f"[green]Successfully restored {restored} resource types from backup.[/green]")
@@ -116,12 +316,15 @@ def restore_backup(backup_path: str = None):
 
 def list_backups():
     """List all available backups with details."""
+    from rich.table import Table
+    console = get_console()
+    
     backup_dir = GLOBAL_CONFIG_DIR / "backups"
     backup_dir.mkdir(exist_ok=True)  # Ensure the directory exists
     
-    backups = sorted(backup_dir.glob("*.zip"), key=os.path.getmtime, reverse=True)
+    entries = sorted(_scan_backups(backup_dir), key=lambda entry: entry.stat().st_mtime, reverse=True)
     
-    if not backups:
+    if not entries:
         console.print("[yellow]No backup files found.[/yellow]")
         return []
     
@@ -132,24 +335,23 @@ def list_backups():
     table.add_column("Created", style="blue", width=20)
     table.add_column("Type", style="yellow", width=10)
     
-    for idx, backup in enumerate(backups, 1):
-        size = backup.stat().st_size
-        created = datetime.datetime.fromtimestamp(backup.stat().st_ctime)
+    for idx, entry in enumerate(entries, 1):
+        name = entry.name
+        st = entry.stat()
         
         # Determine backup type from filename
-        name = backup.stem
         if name.startswith("ai_cli_backup_"):
             btype = "Full"
         else:
-            btype = name.split('_')[0].capitalize()
+            btype = name.split('_', 1)[0].capitalize()
         
         table.add_row(
             str(idx),
-            backup.name,
-            f"{size/1024/1024:.1f} MB",
-            created.strftime("%Y-%m-%d %H:%M"),
+            name,
+            f"{st.st_size/1024/1024:.1f} MB",
+            datetime.datetime.fromtimestamp(st.st_ctime).strftime("%Y-%m-%d %H:%M"),
             btype
         )
     
     console.print(table)
-    return backups
+    return [Path(entry.path) for entry in entries]
@@ -29,12 +29,12 @@ TOOL_CONFIGS = {
     "windsurf": {
         "rules_dir": GLOBAL_RULES_DIR,
         "workflows_dir": WINDSURF_WORKFLOWS_DIR,
-        "profiles_dir": HOME / ".windsurf"
+        "profiles_dir": HOME_DIR / ".windsurf"
     },
     "gemini": {
         "rules_dir": GLOBAL_RULES_DIR,
         "workflows_dir": WINDSURF_WORKFLOWS_DIR,
-        "profiles_dir": HOME / ".gemini"
+        "profiles_dir": HOME_DIR / ".gemini"
     }
 }
 
@@ -48,41 +48,48 @@ class Config:
 
     def _find_project_config(self):
         # Search for .ai.cli directory in parent directories
-        current_dir = Path.cwd()
-        while current_dir != current_dir.parent:
-            if (current_dir / PROJECT_CONFIG_DIR_NAME).is_dir():
-                return current_dir / PROJECT_CONFIG_DIR_NAME / "config.json"
-            current_dir = current_dir.parent
+        # (the filesystem root itself is not searched)
+        cwd = Path.cwd()
+        for directory in (cwd, *cwd.parents)[:-1]:
+            candidate = os.path.join(directory, PROJECT_CONFIG_DIR_NAME)
+            if os.path.isdir(candidate):
+                return Path(candidate) / "config.json"
         return None
 
     def _load_config(self, path):
         if path and path.exists():
-            with open(path, "r") as f:
-                return json.load(f)
+            return json.loads(path.read_bytes())
         return {}
 
     def get(self, key, default=None):
         # Project config overrides global config
         return self.project_config.get(key, self.global_config.get(key, default))
 
+# Set once ensure_directories has run in this process
+_INIT_DONE = False
+
 def ensure_directories():
     """Ensure all required directories exist."""
-    # Create global config directory
-    GLOBAL_CONFIG_DIR.mkdir(exist_ok=True)
+    global _INIT_DONE
+    if _INIT_DONE:
+        return
     
-    # Create content directories
-    for directory in [
-        CONTENT_DIR, RULES_DIR, GLOBAL_RULES_DIR, 
-        PROJECT_RULES_DIR, AMAZONQ_PROFILES_DIR, WINDSURF_WORKFLOWS_DIR
-    ]:
-        directory.mkdir(parents=True, exist_ok=True)
+    directories = {
+        # Global config directory and backups
+        GLOBAL_CONFIG_DIR, GLOBAL_CONFIG_DIR / "backups",
+        # Content directories
+        CONTENT_DIR, RULES_DIR, GLOBAL_RULES_DIR,
+        PROJECT_RULES_DIR, AMAZONQ_PROFILES_DIR, WINDSURF_WORKFLOWS_DIR,
+        # Legacy resource directories (for backward compatibility)
+        *(GLOBAL_CONFIG_DIR / resource_dir for resource_dir in RESOURCE_DIRS),
+    }
     
-    # Create legacy resource directories (for backward compatibility)
-    for resource_dir in RESOURCE_DIRS:
-        (GLOBAL_CONFIG_DIR / resource_dir).mkdir(exist_ok=True)
+    # makedirs creates missing parents, so only the leaves need a call
+    parents = {parent for directory in directories for parent in directory.parents}
+    for directory in directories - parents:
+        os.makedirs(directory, exist_ok=True)
     
-    # Create backups directory
-    (GLOBAL_CONFIG_DIR / "backups").mkdir(exist_ok=True)
+    _INIT_DONE = True
 
 # Initialize and create directories if they don't exist
 def init_config():
@@ -91,17 +98,16 @@ def init_config():
     # Create a default global config if it doesn't exist
     config_path = GLOBAL_CONFIG_DIR / "config.json"
     if not config_path.exists():
-        with open(config_path, "w") as f:
-            json.dump({
-                "git_repo_url": "",
-                "content_dirs": {
-                    "rules": str(RULES_DIR),
-                    "global_rules": str(GLOBAL_RULES_DIR),
-                    "project_rules": str(PROJECT_RULES_DIR),
-                    "amazonq_profiles": str(AMAZONQ_PROFILES_DIR),
-                    "windsurf_workflows": str(WINDSURF_WORKFLOWS_DIR)
-                }
-            }, f, indent=4)
+        config_path.write_bytes(json.dumps({
+            "git_repo_url": "",
+            "content_dirs": {
+                "rules": str(RULES_DIR),
+                "global_rules": str(GLOBAL_RULES_DIR),
+                "project_rules": str(PROJECT_RULES_DIR),
+                "amazonq_profiles": str(AMAZONQ_PROFILES_DIR),
+                "windsurf_workflows": str(WINDSURF_WORKFLOWS_DIR)
+            }
+        }, indent=4).encode('utf-8'))
 
     return Config()
 
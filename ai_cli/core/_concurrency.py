@@ -0,0 +1,24 @@
+"""Thread pool helper shared by content loading, syncing and the tool adapters."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Upper bound on threads for file I/O; the same default ThreadPoolExecutor
+# uses for I/O-bound work
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def thread_map(func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """Call ``func`` on every item on a thread pool and return the results in order.
+
+    The pool gets one thread per item, up to ``IO_WORKERS``; zero or one
+    item runs on the calling thread. The first exception raised by ``func``
+    is re-raised once every call has finished.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
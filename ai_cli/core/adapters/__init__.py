@@ -1,34 +1,37 @@
 """Tool adapters for different AI tools."""
+import importlib
 from pathlib import Path
-from typing import Dict, Type
-from ..core.content import ToolAdapter
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-# Import all adapters here
-from .q_cli import QCLIAdapter
-from .windsurf import WindsurfAdapter
-from .gemini import GeminiAdapter
+if TYPE_CHECKING:
+    from ..content import ToolAdapter
 
-# Map tool names to their adapter classes
-ADAPTERS: Dict[str, Type[ToolAdapter]] = {
-    'q-cli': QCLIAdapter,
-    'windsurf': WindsurfAdapter,
-    'gemini': GeminiAdapter,
+# Map tool names to the module and class of their adapter. Adapters are
+# imported on first use so only the requested tool's module is loaded.
+ADAPTERS: Dict[str, Tuple[str, str]] = {
+    'q-cli': ('.q_cli', 'QCLIAdapter'),
+    'windsurf': ('.windsurf', 'WindsurfAdapter'),
+    'gemini': ('.gemini', 'GeminiAdapter'),
 }
 
-def get_adapter(tool_name: str, config_dir: Path) -> ToolAdapter:
+def get_adapter(tool_name: str, config_dir: Path, **options: Any) -> 'ToolAdapter':
     """Get an adapter for the specified tool.
-    
+
     Args:
         tool_name: Name of the tool (e.g., 'q-cli', 'windsurf', 'gemini')
         config_dir: Base configuration directory for the tool
-        
+        **options: Adapter-specific keyword options (e.g. ``aggregate_rules``
+            for 'q-cli')
+
     Returns:
         An instance of the appropriate adapter class
-        
+
     Raises:
         ValueError: If no adapter is available for the specified tool
     """
-    adapter_class = ADAPTERS.get(tool_name.lower())
-    if not adapter_class:
+    entry = ADAPTERS.get(tool_name.lower())
+    if not entry:
         raise ValueError(f"No adapter available for tool: {tool_name}")
-    return adapter_class(tool_name, config_dir)
+    module_name, class_name = entry
+    adapter_class = getattr(importlib.import_module(module_name, __name__), class_name)
+    return adapter_class(tool_name, config_dir, **options)
@@ -1,10 +1,15 @@
 """Adapter for Google Gemini AI tool."""
 from pathlib import Path
-from typing import Dict, Any, Optional
-import yaml
+from typing import Dict, Any, Iterable, Optional
 import shutil
 import os
+from functools import partial
+from .._concurrency import thread_map
 from ..content import ToolAdapter, Rule, Workflow, Profile
+from ..serialization import dump_yaml, emit_item
+
+# Every item becomes a prompt template; only the description is copied as is
+_PROMPT_SCHEMA = (('description', ''),)
 
 class GeminiAdapter(ToolAdapter):
     """Adapter for Google Gemini AI tool."""
@@ -17,19 +22,16 @@ class GeminiAdapter(ToolAdapter):
         # Create required directories
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
     
-    def sync_rule(self, rule: Rule) -> None:
+    def sync_rule(self, rule: Rule, force: bool = False) -> Optional[str]:
         """Sync a rule to Gemini format."""
-        # Gemini doesn't directly support rules, so we'll convert them to prompt templates
-        gemini_prompt = {
-            'name': f"rule_{rule.name}",
-            'description': rule.content.get('description', ''),
-            'template': self._rule_to_prompt(rule)
-        }
-        
-        # Save as a prompt template
         prompt_path = self.prompts_dir / f"rule_{rule.name}.yaml"
-        with open(prompt_path, 'w') as f:
-            yaml.dump(gemini_prompt, f, default_flow_style=False)
+        if not force and self._is_up_to_date(rule, prompt_path):
+            return prompt_path.stem
+        
+        # Gemini doesn't directly support rules, so we'll convert them to prompt templates
+        emit_item(rule, _PROMPT_SCHEMA, prompt_path, 'yaml',
+                  name=prompt_path.stem, template=self._rule_to_prompt(rule))
+        return prompt_path.stem
     
     def _rule_to_prompt(self, rule: Rule) -> str:
         """Convert a rule to a prompt template string."""
@@ -42,22 +44,19 @@ class GeminiAdapter(ToolAdapter):
             f"## Actions\n{actions}"
         )
     
-    def sync_profile(self, profile: Profile) -> None:
+    def sync_profile(self, profile: Profile, force: bool = False) -> Optional[str]:
         """Sync a profile to Gemini format."""
         if profile.tool != 'gemini':
-            return  # Skip profiles for other tools
+            return None  # Skip profiles for other tools
             
-        # For Gemini, we'll create a prompt template for the profile
-        gemini_prompt = {
-            'name': f"profile_{profile.name}",
-            'description': profile.content.get('description', ''),
-            'template': self._profile_to_prompt(profile)
-        }
-        
-        # Save as a prompt template
         prompt_path = self.prompts_dir / f"profile_{profile.name}.yaml"
-        with open(prompt_path, 'w') as f:
-            yaml.dump(gemini_prompt, f, default_flow_style=False)
+        if not force and self._is_up_to_date(profile, prompt_path):
+            return prompt_path.stem
+        
+        # For Gemini, we'll create a prompt template for the profile
+        emit_item(profile, _PROMPT_SCHEMA, prompt_path, 'yaml',
+                  name=prompt_path.stem, template=self._profile_to_prompt(profile))
+        return prompt_path.stem
     
     def _profile_to_prompt(self, profile: Profile) -> str:
         """Convert a profile to a prompt template string."""
@@ -68,19 +67,16 @@ class GeminiAdapter(ToolAdapter):
             f"## Settings\n{settings}\n"
         )
     
-    def sync_workflow(self, workflow: Workflow) -> None:
+    def sync_workflow(self, workflow: Workflow, force: bool = False) -> Optional[str]:
         """Sync a workflow to Gemini format."""
-        # Convert workflow to a prompt template
-        gemini_workflow = {
-            'name': f"workflow_{workflow.name}",
-            'description': workflow.content.get('description', ''),
-            'template': self._workflow_to_prompt(workflow)
-        }
-        
-        # Save as a prompt template
         workflow_path = self.prompts_dir / f"workflow_{workflow.name}.yaml"
-        with open(workflow_path, 'w') as f:
-            yaml.dump(gemini_workflow, f, default_flow_style=False)
+        if not force and self._is_up_to_date(workflow, workflow_path):
+            return workflow_path.stem
+        
+        # Convert workflow to a prompt template
+        emit_item(workflow, _PROMPT_SCHEMA, workflow_path, 'yaml',
+                  name=workflow_path.stem, template=self._workflow_to_prompt(workflow))
+        return workflow_path.stem
     
     def _workflow_to_prompt(self, workflow: Workflow) -> str:
         """Convert a workflow to a prompt template string."""
@@ -91,38 +87,43 @@ class GeminiAdapter(ToolAdapter):
             f"## Steps\n{steps}\n"
         )
     
-    def sync(self, content_manager) -> None:
-        """Sync all content to Gemini configuration."""
-        # Clear existing prompts
-        for f in self.prompts_dir.glob('*'):
-            if f.is_file():
-                f.unlink()
+    def sync(self, content_manager, *, force: bool = False) -> None:
+        """Sync all content to Gemini configuration.
         
-        # Sync rules as prompt templates
-        for rule in content_manager.list_rules():
-            self.sync_rule(rule)
+        Prompts that are newer than their source are left alone unless
+        ``force`` is set.
+        """
+        # Items are independent, so write them concurrently
+        written = [
+            *thread_map(partial(self.sync_rule, force=force), content_manager.list_rules()),
+            *thread_map(partial(self.sync_profile, force=force), content_manager.list_profiles()),
+            *thread_map(partial(self.sync_workflow, force=force), content_manager.list_workflows()),
+        ]
         
-        # Sync profiles as prompt templates
-        for profile in content_manager.list_profiles():
-            self.sync_profile(profile)
-        
-        # Sync workflows as prompt templates
-        for workflow in content_manager.list_workflows():
-            self.sync_workflow(workflow)
+        # Remove prompts whose source item no longer exists
+        keep = {f"{name}.yaml" for name in written if name is not None}
+        with os.scandir(self.prompts_dir) as it:
+            for entry in it:
+                if entry.name not in keep and entry.is_file():
+                    os.unlink(entry.path)
         
         # Update main Gemini config
-        self._update_main_config()
+        self._update_main_config(written)
     
-    def _update_main_config(self) -> None:
-        """Update the main Gemini configuration file."""
+    def _update_main_config(self, written: Iterable[Optional[str]]) -> None:
+        """Update the main Gemini configuration file.
+        
+        Args:
+            written: Prompt names written by ``sync``; ``None`` entries mark
+                skipped items.
+        """
         config = {
             'prompts_dir': str(self.prompts_dir.relative_to(self.config_dir)),
             'prompts': {
-                f.stem: {'enabled': True}
-                for f in self.prompts_dir.glob('*.yaml')
+                name: {'enabled': True}
+                for name in written if name is not None
             }
         }
         
         # Save updated config
-        with open(self.config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        self.config_file.write_bytes(dump_yaml(config))
@@ -1,16 +1,29 @@
 """Adapter for Amazon Q CLI tool."""
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import yaml
 import shutil
 import os
+from functools import partial
+from .._concurrency import thread_map
 from ..content import ToolAdapter, Rule, Workflow, Profile
+from ..serialization import (
+    SafeLoader, dump_yaml, emit_item, item_payload, RULE_SCHEMA, PROFILE_SCHEMA, WORKFLOW_SCHEMA
+)
 
 class QCLIAdapter(ToolAdapter):
-    """Adapter for Amazon Q CLI tool."""
+    """Adapter for Amazon Q CLI tool.
     
-    def __init__(self, tool_name: str, config_dir: Path):
+    Args:
+        tool_name: Name of the tool.
+        config_dir: Base configuration directory for the tool.
+        aggregate_rules: Write every rule to a single ``rules/rules.yaml``
+            file instead of one file per rule.
+    """
+    
+    def __init__(self, tool_name: str, config_dir: Path, *, aggregate_rules: bool = False):
         super().__init__(tool_name, config_dir)
+        self.aggregate_rules = aggregate_rules
         self.rules_dir = self.config_dir / 'rules'
         self.profiles_dir = self.config_dir / 'profiles'
         self.workflows_dir = self.config_dir / 'workflows'
@@ -19,75 +32,81 @@ class QCLIAdapter(ToolAdapter):
         for directory in [self.rules_dir, self.profiles_dir, self.workflows_dir]:
             directory.mkdir(parents=True, exist_ok=True)
     
-    def sync_rule(self, rule: Rule) -> None:
+    def sync_rule(self, rule: Rule, force: bool = False) -> Optional[str]:
         """Sync a single rule to Q CLI format."""
-        q_rule = {
-            'name': rule.name,
-            'description': rule.content.get('description', ''),
-            'enabled': rule.content.get('enabled', True),
-            'conditions': rule.content.get('conditions', []),
-            'actions': rule.content.get('actions', [])
-        }
-        
-        # Save to Q CLI rules directory
         rule_path = self.rules_dir / f"{rule.name}.yaml"
-        with open(rule_path, 'w') as f:
-            yaml.dump(q_rule, f, default_flow_style=False)
+        if not force and self._is_up_to_date(rule, rule_path):
+            return rule.name
+        
+        emit_item(rule, RULE_SCHEMA, rule_path, 'yaml')
+        return rule.name
     
-    def sync_profile(self, profile: Profile) -> None:
+    def sync_profile(self, profile: Profile, force: bool = False) -> Optional[str]:
         """Sync a profile to Q CLI format."""
         if profile.tool != 'q-cli':
-            return  # Skip profiles for other tools
+            return None  # Skip profiles for other tools
             
-        q_profile = {
-            'name': profile.name,
-            'description': profile.content.get('description', ''),
-            'settings': profile.content.get('settings', {})
-        }
-        
-        # Save to Q CLI profiles directory
         profile_path = self.profiles_dir / f"{profile.name}.yaml"
-        with open(profile_path, 'w') as f:
-            yaml.dump(q_profile, f, default_flow_style=False)
+        if not force and self._is_up_to_date(profile, profile_path):
+            return profile.name
+        
+        emit_item(profile, PROFILE_SCHEMA, profile_path, 'yaml')
+        return profile.name
     
-    def sync_workflow(self, workflow: Workflow) -> None:
+    def sync_workflow(self, workflow: Workflow, force: bool = False) -> Optional[str]:
         """Sync a workflow to Q CLI format."""
-        q_workflow = {
-            'name': workflow.name,
-            'description': workflow.content.get('description', ''),
-            'steps': workflow.content.get('steps', [])
-        }
-        
-        # Save to Q CLI workflows directory
         workflow_path = self.workflows_dir / f"{workflow.name}.yaml"
-        with open(workflow_path, 'w') as f:
-            yaml.dump(q_workflow, f, default_flow_style=False)
+        if not force and self._is_up_to_date(workflow, workflow_path):
+            return workflow.name
+        
+        emit_item(workflow, WORKFLOW_SCHEMA, workflow_path, 'yaml')
+        return workflow.name
     
-    def sync(self, content_manager) -> None:
-        """Sync all content to Q CLI configuration."""
-        # Sync rules
-        for rule in content_manager.list_rules():
-            self.sync_rule(rule)
+    def sync_rules_file(self, rules: List[Rule]) -> List[str]:
+        """Write all rules to a single Q CLI rules file.
         
-        # Sync profiles (only Q-CLI specific ones)
-        for profile in content_manager.list_profiles():
-            self.sync_profile(profile)
+        Returns:
+            The names of the rules written.
+        """
+        payloads = [item_payload(rule, RULE_SCHEMA) for rule in rules]
+        (self.rules_dir / 'rules.yaml').write_bytes(dump_yaml({'rules': payloads}))
+        return [payload['name'] for payload in payloads]
+    
+    def sync(self, content_manager, *, force: bool = False) -> None:
+        """Sync all content to Q CLI configuration.
         
-        # Sync workflows
-        for workflow in content_manager.list_workflows():
-            self.sync_workflow(workflow)
+        Files that are newer than their source are left alone unless
+        ``force`` is set. With ``aggregate_rules`` the rules file is always
+        rewritten.
+        """
+        # Items are independent, so write them concurrently
+        if self.aggregate_rules:
+            rules = self.sync_rules_file(content_manager.list_rules())
+        else:
+            rules = thread_map(partial(self.sync_rule, force=force), content_manager.list_rules())
+        written = {
+            'rules': rules,
+            'profiles': thread_map(
+                partial(self.sync_profile, force=force), content_manager.list_profiles()),
+            'workflows': thread_map(
+                partial(self.sync_workflow, force=force), content_manager.list_workflows()),
+        }
         
         # Create or update main Q CLI config
-        self._update_main_config()
+        self._update_main_config(written)
     
-    def _update_main_config(self) -> None:
-        """Update the main Q CLI configuration file."""
+    def _update_main_config(self, written: Dict[str, List[Optional[str]]]) -> None:
+        """Update the main Q CLI configuration file.
+        
+        Args:
+            written: Names written by ``sync``, keyed by section. ``None``
+                entries mark skipped items.
+        """
         config_path = self.config_dir / 'config.yaml'
         config = {}
         
         if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
+            config = yaml.load(config_path.read_bytes(), Loader=SafeLoader) or {}
         
         # Ensure default sections exist
         config.setdefault('rules', {})
@@ -95,21 +114,11 @@ class QCLIAdapter(ToolAdapter):
         config.setdefault('workflows', {})
         
         # Update with current rules, profiles, and workflows
-        config['rules'] = {
-            f.name[:-5]: {'enabled': True}  # Remove .yaml extension
-            for f in self.rules_dir.glob('*.yaml')
-        }
-        
-        config['profiles'] = {
-            f.name[:-5]: {'enabled': True}  # Remove .yaml extension
-            for f in self.profiles_dir.glob('*.yaml')
-        }
-        
-        config['workflows'] = {
-            f.name[:-5]: {'enabled': True}  # Remove .yaml extension
-            for f in self.workflows_dir.glob('*.yaml')
-        }
+        for section in ('rules', 'profiles', 'workflows'):
+            config[section] = {
+                name: {'enabled': True}
+                for name in written[section] if name is not None
+            }
         
         # Save updated config
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        config_path.write_bytes(dump_yaml(config))
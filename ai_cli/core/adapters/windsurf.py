@@ -1,10 +1,11 @@
 """Adapter for Windsurf AI tool."""
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import json
 import shutil
 import os
 from ..content import ToolAdapter, Rule, Workflow, Profile
+from ..serialization import dump_json, load_json, emit_item, RULE_SCHEMA, PROFILE_SCHEMA
 
 class WindsurfAdapter(ToolAdapter):
     """Adapter for Windsurf AI tool."""
@@ -18,77 +19,72 @@ class WindsurfAdapter(ToolAdapter):
         for directory in [self.personas_dir, self.rules_dir]:
             directory.mkdir(parents=True, exist_ok=True)
     
-    def sync_rule(self, rule: Rule) -> None:
+    def sync_rule(self, rule: Rule, force: bool = False) -> Optional[str]:
         """Sync a rule to Windsurf format."""
-        windsurf_rule = {
-            'name': rule.name,
-            'description': rule.content.get('description', ''),
-            'enabled': rule.content.get('enabled', True),
-            'conditions': rule.content.get('conditions', []),
-            'actions': rule.content.get('actions', [])
-        }
-        
-        # Save to Windsurf rules directory
         rule_path = self.rules_dir / f"{rule.name}.json"
-        with open(rule_path, 'w') as f:
-            json.dump(windsurf_rule, f, indent=2)
+        if not force and self._is_up_to_date(rule, rule_path):
+            return rule.name
+        
+        emit_item(rule, RULE_SCHEMA, rule_path, 'json')
+        return rule.name
     
-    def sync_profile_as_persona(self, profile: Profile) -> None:
+    def sync_profile_as_persona(self, profile: Profile, force: bool = False) -> Optional[str]:
         """Sync a profile as a Windsurf persona."""
         if profile.tool != 'windsurf':
-            return  # Skip profiles for other tools
+            return None  # Skip profiles for other tools
             
-        persona = {
-            'name': profile.name,
-            'description': profile.content.get('description', ''),
-            'settings': profile.content.get('settings', {})
-        }
-        
-        # Save to Windsurf personas directory
         persona_path = self.personas_dir / f"{profile.name}.json"
-        with open(persona_path, 'w') as f:
-            json.dump(persona, f, indent=2)
+        if not force and self._is_up_to_date(profile, persona_path):
+            return profile.name
+        
+        emit_item(profile, PROFILE_SCHEMA, persona_path, 'json')
+        return profile.name
     
-    def sync(self, content_manager) -> None:
-        """Sync all content to Windsurf configuration."""
-        # Sync rules
-        for rule in content_manager.list_rules():
-            self.sync_rule(rule)
+    def sync(self, content_manager, *, force: bool = False) -> None:
+        """Sync all content to Windsurf configuration.
         
-        # Sync profiles as personas
-        for profile in content_manager.list_profiles():
-            self.sync_profile_as_persona(profile)
+        Files that are newer than their source are left alone unless
+        ``force`` is set.
+        """
+        written = {
+            # Sync rules
+            'rules': [self.sync_rule(rule, force) for rule in content_manager.list_rules()],
+            # Sync profiles as personas
+            'personas': [
+                self.sync_profile_as_persona(profile, force)
+                for profile in content_manager.list_profiles()
+            ],
+        }
         
         # Update main Windsurf config
-        self._update_main_config()
+        self._update_main_config(written)
     
-    def _update_main_config(self) -> None:
-        """Update the main Windsurf configuration file."""
+    def _update_main_config(self, written: Dict[str, List[Optional[str]]]) -> None:
+        """Update the main Windsurf configuration file.
+        
+        Args:
+            written: Names written by ``sync``, keyed by section. ``None``
+                entries mark skipped items.
+        """
         config_path = self.config_dir / 'config.json'
         config = {}
         
         if config_path.exists():
-            with open(config_path) as f:
-                try:
-                    config = json.load(f) or {}
-                except json.JSONDecodeError:
-                    config = {}
+            try:
+                config = load_json(config_path.read_bytes()) or {}
+            except json.JSONDecodeError:
+                config = {}
         
         # Ensure default sections exist
         config.setdefault('personas', {})
         config.setdefault('rules', {})
         
         # Update with current personas and rules
-        config['personas'] = {
-            f.stem: {'enabled': True}
-            for f in self.personas_dir.glob('*.json')
-        }
-        
-        config['rules'] = {
-            f.stem: {'enabled': True}
-            for f in self.rules_dir.glob('*.json')
-        }
+        for section in ('personas', 'rules'):
+            config[section] = {
+                name: {'enabled': True}
+                for name in written[section] if name is not None
+            }
         
         # Save updated config
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_path.write_bytes(dump_json(config))
@@ -1,12 +1,19 @@
 """Core content management for AI CLI tools."""
 from pathlib import Path
-from typing import Dict, List, Optional, Type, TypeVar, Generic, Any, Callable, Set, Union
+from typing import Dict, List, Optional, Type, TypeVar, Generic, Any, Callable, Set, Tuple, Union
 from dataclasses import dataclass, field, asdict
+import os
+import sys
+import fnmatch
 import yaml
-import json
 import shutil
 from enum import Enum, auto
 import logging
+import queue
+import threading
+
+from ._concurrency import thread_map
+from .serialization import ContentLoader, dump_json, dump_yaml, load_json, write_atomic
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -14,6 +21,13 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound='ContentItem')
 
+# Content file suffixes, in the order get_item prefers them
+_LOOKUP_SUFFIXES = ('.yaml', '.yml', '.json')
+
+# Items loaded ahead of the adapter in sync_to_tool, and the end-of-load marker
+_SYNC_QUEUE_SIZE = 32
+_LOAD_DONE = object()
+
 class ContentType(Enum):
     """Types of content that can be managed."""
     RULE = 'rules'
@@ -32,6 +46,37 @@ class ContentType(Enum):
         """Get the directory path for a content type."""
         return base_dir / content_type.value
 
+# Content types by their string value, for cheap normalization of arguments
+_CONTENT_TYPES_BY_VALUE = {content_type.value: content_type for content_type in ContentType}
+
+def _as_content_type(content_type: Union[ContentType, str]) -> ContentType:
+    """Return ``content_type`` as a ContentType member.
+    
+    Raises:
+        ValueError: If a string does not name a content type.
+    """
+    if type(content_type) is ContentType:
+        return content_type
+    return _CONTENT_TYPES_BY_VALUE.get(content_type) or ContentType(content_type)
+
+def _intern_keys(mapping: Dict[Any, Any], depth: int) -> Dict[Any, Any]:
+    """Return ``mapping`` with its string keys interned.
+    
+    Content files repeat the same few keys ('description', 'steps', ...), so
+    interning lets every loaded item share one copy of each. Nested dicts are
+    handled down to ``depth`` levels.
+    """
+    depth -= 1
+    return {
+        (sys.intern(key) if type(key) is str else key):
+        (_intern_keys(value, depth) if depth and isinstance(value, dict) else value)
+        for key, value in mapping.items()
+    }
+
+# Content types saved as YAML by default; everything else is saved as JSON
+_YAML_TYPES = frozenset({ContentType.RULE, ContentType.WORKFLOW, ContentType.PROFILE})
+_EXT_FOR = {True: '.yaml', False: '.json'}
+
 @dataclass
 class ContentItem:
     """Base class for all content items (rules, workflows, profiles)."""
@@ -40,6 +85,8 @@ class ContentItem:
     content_type: ContentType
     path: Optional[Path] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # st_mtime_ns of the file the item was listed from, if any
+    source_mtime: Optional[int] = field(default=None, compare=False, repr=False)
     
     def __post_init__(self):
         """Validate the content item after initialization."""
@@ -60,15 +107,15 @@ class ContentItem:
         """Convert the content item to a dictionary."""
         return {
             'name': self.name,
-            'content_type': self.content_type.value,
             'content': self.content,
+            'content_type': self.content_type.value,
             'metadata': self.metadata
         }
     
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
         """Create a content item from a dictionary."""
-        content_type = ContentType(data.get('content_type', 'rules'))
+        content_type = _as_content_type(data.get('content_type', 'rules'))
         return cls(
             name=data['name'],
             content_type=content_type,
@@ -92,23 +139,29 @@ class ContentItem:
         if base_dir is None and self.path is None and filename is None:
             raise ValueError("Either base_dir or path must be provided")
         
+        # Default extension and file name for this item
+        ext = _EXT_FOR[self.content_type in _YAML_TYPES]
+        default_filename = f"{self.name.lower().replace(' ', '_')}{ext}"
+        
         # Determine the save path
-        logger.debug(f"save() called with filename={filename}, base_dir={base_dir}, self.path={self.path}")
-        logger.debug(f"Type of filename: {type(filename)}")
-        logger.debug(f"Content type: {self.content_type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("save() called with filename=%s, base_dir=%s, self.path=%s", filename, base_dir, self.path)
+            logger.debug("Type of filename: %s", type(filename))
+            logger.debug("Content type: %s", self.content_type)
         
         # Special case: user passed a single positional argument that is actually a file path
         if filename is None and base_dir is not None and Path(base_dir).suffix in {'.yaml', '.yml', '.json'}:
             save_path = Path(base_dir)
-            logger.debug(f"Detected file path passed as base_dir positional arg: {save_path}")
+            logger.debug("Detected file path passed as base_dir positional arg: %s", save_path)
             base_dir = None  # prevent further use
             filename = None  # ensure no further filename processing
         
         if filename is not None:
             # If a filename is provided, use it as is
             filename = Path(filename)
-            logger.debug(f"Processing filename: {filename}")
-            logger.debug(f"Filename parts: name={filename.name}, suffix={filename.suffix}, parent={filename.parent}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing filename: %s", filename)
+                logger.debug("Filename parts: name=%s, suffix=%s, parent=%s", filename.name, filename.suffix, filename.parent)
             
             if base_dir is not None:
                 # If base_dir is provided, join it with the filename
@@ -121,53 +174,44 @@ class ContentItem:
                         save_path = base_dir / filename
                     else:
                         # If no extension, treat it as a directory and append a filename
-                        ext = '.yaml' if self.content_type in [ContentType.RULE, ContentType.WORKFLOW, ContentType.PROFILE] else '.json'
-                        default_filename = f"{self.name.lower().replace(' ', '_')}{ext}"
                         save_path = base_dir / filename / default_filename
-                logger.debug(f"Combined with base_dir: {save_path}")
+                logger.debug("Combined with base_dir: %s", save_path)
             else:
                 # If no base_dir, use the filename as is
                 save_path = filename
-                logger.debug(f"Using filename as is: {save_path}")
+                logger.debug("Using filename as is: %s", save_path)
                 
         elif self.path is not None:
             # If the item already has a path, use it
             save_path = Path(self.path)
-            logger.debug(f"Using existing path: {save_path}")
+            logger.debug("Using existing path: %s", save_path)
         else:
             # Generate a filename based on content type and name
-            ext = '.yaml' if self.content_type in [ContentType.RULE, ContentType.WORKFLOW, ContentType.PROFILE] else '.json'
-            filename = f"{self.name.lower().replace(' ', '_')}{ext}"
-            save_path = base_dir / filename if base_dir else Path(filename)
-            logger.debug(f"Generated save path: {save_path}")
+            save_path = base_dir / default_filename if base_dir else Path(default_filename)
+            logger.debug("Generated save path: %s", save_path)
         
         # Ensure the save path has the correct extension if it's not already set
         if not save_path.suffix:
-            ext = '.yaml' if self.content_type in [ContentType.RULE, ContentType.WORKFLOW, ContentType.PROFILE] else '.json'
             save_path = save_path.with_suffix(ext)
         
         # Ensure the directory exists
-        logger.debug(f"Ensuring directory exists: {save_path.parent}")
+        logger.debug("Ensuring directory exists: %s", save_path.parent)
         save_path.parent.mkdir(parents=True, exist_ok=True)
         
-        logger.debug(f"Saving to file: {save_path}")
+        logger.debug("Saving to file: %s", save_path)
         
         # Convert the content item to a dictionary
-        data = {
-            'name': self.name,
-            'content': self.content,
-            'content_type': self.content_type.value,
-            'metadata': self.metadata
-        }
+        data = self.to_dict()
         
-        # Save the file
-        with open(save_path, 'w', encoding='utf-8') as f:
-            if save_path.suffix in ('.yaml', '.yml'):
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            elif save_path.suffix == '.json':
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            else:
-                raise ValueError(f"Unsupported file format: {save_path.suffix}")
+        # Serialize in memory and save the file with a single write
+        if save_path.suffix in ('.yaml', '.yml'):
+            payload = dump_yaml(data, sort_keys=False)
+        elif save_path.suffix == '.json':
+            payload = dump_json(data)
+        else:
+            raise ValueError(f"Unsupported file format: {save_path.suffix}")
+        
+        write_atomic(save_path, payload)
         
         self.path = save_path
         logger.info(f"Saved {self.content_type.value} '{self.name}' to {save_path}")
@@ -187,36 +231,54 @@ class ContentItem:
             ValueError: If the file format is not supported.
         """
         filepath = Path(filepath)
-        if not filepath.exists():
-            raise FileNotFoundError(f"File not found: {filepath}")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            if filepath.suffix in ('.yaml', '.yml'):
-                data = yaml.safe_load(f)
-            elif filepath.suffix == '.json':
-                data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {filepath.suffix}")
+        suffix = filepath.suffix
+        if suffix not in _LOOKUP_SUFFIXES:
+            if not filepath.exists():
+                raise FileNotFoundError(f"File not found: {filepath}")
+            raise ValueError(f"Unsupported file format: {suffix}")
+        
+        # Content files are small; read each in one call and parse from memory.
+        # A missing file surfaces from the read itself rather than a separate stat.
+        try:
+            raw = filepath.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}") from None
+        return cls.load_from_bytes(raw, filepath)
+    
+    @classmethod
+    def load_from_bytes(cls, raw: bytes, filepath: Union[str, Path]) -> 'ContentItem':
+        """Create a content item from the contents of a file that was already read.
+        
+        Args:
+            raw: The file contents.
+            filepath: Path the contents were read from; its suffix selects the
+                parser and it becomes the item's path.
+            
+        Returns:
+            ContentItem: The loaded content item.
+            
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        filepath = Path(filepath)
+        suffix = filepath.suffix
+        if suffix not in _LOOKUP_SUFFIXES:
+            raise ValueError(f"Unsupported file format: {suffix}")
+        data = load_json(raw) if suffix == '.json' else yaml.load(raw, Loader=ContentLoader)
+        content = data.get('content')
+        if isinstance(content, dict):
+            data['content'] = _intern_keys(content, depth=2)
         
         # Determine content type from filepath if not in data
-        if 'content_type' not in data:
+        if 'content_type' in data:
+            content_type = _as_content_type(data['content_type'])
+        else:
             # Infer from parent directory name
-            parent_dir = filepath.parent.name
-            try:
-                data['content_type'] = ContentType(parent_dir).value
-            except ValueError:
-                data['content_type'] = ContentType.RULE.value
+            content_type = _CONTENT_TYPES_BY_VALUE.get(filepath.parent.name, ContentType.RULE)
+        data['content_type'] = content_type
         
         # Create the appropriate content item class
-        content_type = ContentType(data['content_type'])
-        if content_type in [ContentType.RULE, ContentType.GLOBAL_RULE, ContentType.PROJECT_RULE]:
-            item = Rule.from_dict(data)
-        elif content_type in [ContentType.WORKFLOW, ContentType.WINDSURF_WORKFLOW]:
-            item = Workflow.from_dict(data)
-        elif content_type in [ContentType.PROFILE, ContentType.AMAZONQ_PROFILE]:
-            item = Profile.from_dict(data)
-        else:
-            item = cls.from_dict(data)
+        item = _ITEM_CLASSES.get(content_type, cls).from_dict(data)
         
         item.path = filepath
         return item
@@ -229,7 +291,7 @@ class Rule(ContentItem):
     def __post_init__(self):
         """Set content type and validate."""
         if isinstance(self.content_type, str):
-            self.content_type = ContentType(self.content_type)
+            self.content_type = _as_content_type(self.content_type)
         super().__post_init__()
     
     def validate(self) -> None:
@@ -246,7 +308,7 @@ class Workflow(ContentItem):
     def __post_init__(self):
         """Set content type and validate."""
         if isinstance(self.content_type, str):
-            self.content_type = ContentType(self.content_type)
+            self.content_type = _as_content_type(self.content_type)
         super().__post_init__()
     
     def validate(self) -> None:
@@ -283,6 +345,7 @@ class Profile(ContentItem):
         self.content = content
         self.path = path
         self.metadata = metadata or {}
+        self.source_mtime = None
         self.content_type = ContentType.PROFILE
         
         # Call post-init for validation
@@ -291,7 +354,7 @@ class Profile(ContentItem):
     def __post_init__(self):
         """Set content type and validate."""
         if isinstance(self.content_type, str):
-            self.content_type = ContentType(self.content_type)
+            self.content_type = _as_content_type(self.content_type)
         super().__post_init__()
     
     def validate(self) -> None:
@@ -303,6 +366,17 @@ class Profile(ContentItem):
             raise ValueError("Profile content must be a dictionary")
 
 
+# Item class used by ContentItem.load for each content type
+_ITEM_CLASSES = {
+    ContentType.RULE: Rule,
+    ContentType.GLOBAL_RULE: Rule,
+    ContentType.PROJECT_RULE: Rule,
+    ContentType.WORKFLOW: Workflow,
+    ContentType.WINDSURF_WORKFLOW: Workflow,
+    ContentType.PROFILE: Profile,
+    ContentType.AMAZONQ_PROFILE: Profile,
+}
+
 class ContentManager:
     """Manages content items (rules, workflows, profiles) for AI tools."""
     
@@ -314,11 +388,19 @@ class ContentManager:
         """
         self.base_dir = base_dir.resolve()
         self.content_dirs = {}
+        # Parsed items keyed by file path, tagged with the mtime and size of
+        # the file they were loaded from
+        self._item_cache: Dict[str, Tuple[int, int, ContentItem]] = {}
+        # Per content type: item name -> file, and the mtimes of the
+        # directories that name index was built from
+        self._index: Dict[ContentType, Dict[str, Path]] = {}
+        self._index_mtime: Dict[ContentType, Dict[str, int]] = {}
         
         # Initialize content directories
         for content_type in ContentType.__members__.values():
             dir_path = base_dir / content_type.value
-            dir_path.mkdir(parents=True, exist_ok=True)
+            if not os.path.isdir(dir_path):
+                dir_path.mkdir(parents=True, exist_ok=True)
             self.content_dirs[content_type] = dir_path
         
         logger.info(f"Initialized ContentManager with base directory: {self.base_dir}")
@@ -342,9 +424,10 @@ class ContentManager:
             raise FileExistsError(f"{item.content_type.value} '{item.name}' already exists")
         
         # Save the item
-        logger.debug(f"Saving item of type {item.content_type} to {self.content_dirs[item.content_type]}")
+        logger.debug("Saving item of type %s to %s", item.content_type, self.content_dirs[item.content_type])
         save_path = item.save(self.content_dirs[item.content_type])
-        logger.debug(f"Item saved to: {save_path}")
+        self._invalidate_index(item.content_type)
+        logger.debug("Item saved to: %s", save_path)
         return save_path
     
     def get_item(self, content_type: Union[ContentType, str], name: str) -> Optional[ContentItem]:
@@ -357,27 +440,77 @@ class ContentManager:
         Returns:
             Optional[ContentItem]: The content item, or None if not found.
         """
-        if isinstance(content_type, str):
-            content_type = ContentType(content_type)
-        
-        # Search for the item in the appropriate directory and its subdirectories
-        content_dir = self.content_dirs[content_type]
-        for ext in ['.yaml', '.yml', '.json']:
-            # Try direct path first (for backward compatibility)
-            filepath = content_dir / f"{name}{ext}"
-            if filepath.exists():
-                return ContentItem.load(filepath)
-                
-            # Try subdirectories
-            for filepath in content_dir.glob(f"**/{name}{ext}"):
-                if filepath.is_file():
-                    return ContentItem.load(filepath)
+        content_type = _as_content_type(content_type)
+        filepath = self._get_index(content_type).get(name)
+        return ContentItem.load(filepath) if filepath else None
+    
+    def _get_index(self, content_type: ContentType) -> Dict[str, Path]:
+        """Return the name -> file index for a content type, rebuilding it if stale.
+        
+        The index is reused while every directory it was built from keeps
+        its modification time, since adding, removing or renaming an entry
+        updates the mtime of the containing directory.
+        """
+        dir_mtimes = self._index_mtime.get(content_type)
+        if dir_mtimes is not None:
+            try:
+                if all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items()):
+                    return self._index[content_type]
+            except FileNotFoundError:
+                pass
+        
+        index, dir_mtimes = self._build_index(self.content_dirs[content_type])
+        self._index[content_type] = index
+        self._index_mtime[content_type] = dir_mtimes
+        return index
+    
+    @staticmethod
+    def _build_index(content_dir: Path) -> Tuple[Dict[str, Path], Dict[str, int]]:
+        """Map item names to files below ``content_dir`` in one recursive scan.
         
-        return None
+        When a name exists more than once, '.yaml' beats '.yml' beats
+        '.json', and a file directly in ``content_dir`` beats one in a
+        subdirectory.
+        """
+        index: Dict[str, Path] = {}
+        ranks: Dict[str, Tuple[int, bool]] = {}
+        dir_mtimes: Dict[str, int] = {}
+        stack = [(str(content_dir), False)]
+        while stack:
+            directory, nested = stack.pop()
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                it = os.scandir(directory)
+            except FileNotFoundError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, True))
+                        continue
+                    stem, dot, ext = entry.name.rpartition('.')
+                    suffix = dot + ext
+                    if not stem or suffix not in _LOOKUP_SUFFIXES or not entry.is_file():
+                        continue
+                    rank = (_LOOKUP_SUFFIXES.index(suffix), nested)
+                    if stem not in ranks or rank < ranks[stem]:
+                        ranks[stem] = rank
+                        index[stem] = Path(entry.path)
+        return index, dir_mtimes
+    
+    def _invalidate_index(self, content_type: ContentType) -> None:
+        """Drop the cached name index for a content type."""
+        self._index.pop(content_type, None)
+        self._index_mtime.pop(content_type, None)
     
     def list_items(self, content_type: Union[ContentType, str], pattern: str = '*') -> List[ContentItem]:
         """List all content items of a specific type.
         
+        Files whose modification time and size are unchanged since they were
+        last parsed are served from the item cache. Cached items are shared:
+        every call (and every caller) gets the same objects, so treat them as
+        read-only and copy one before changing it.
+        
         Args:
             content_type: Type of content to list.
             pattern: Glob pattern to filter items.
@@ -385,18 +518,99 @@ class ContentManager:
         Returns:
             List[ContentItem]: List of content items.
         """
-        if isinstance(content_type, str):
-            content_type = ContentType(content_type)
+        content_type = _as_content_type(content_type)
+        paths = self._find_files(content_type, pattern)
+        if not paths:
+            return []
+        
+        items: List[Optional[ContentItem]] = [None] * len(paths)
+        stale = []
+        for i, filepath in enumerate(paths):
+            try:
+                st = os.stat(filepath)
+            except OSError as e:
+                logger.warning(f"Error loading {content_type.value} from {filepath}: {e}")
+                continue
+            cached = self._item_cache.get(filepath)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                items[i] = cached[2]
+            else:
+                stale.append((i, filepath, st))
+        if not stale:
+            return [item for item in items if item is not None]
         
-        items = []
-        for ext in ['*.yaml', '*.yml', '*.json']:
-            for filepath in self.content_dirs[content_type].glob(f"{pattern}{ext[1:]}"):
-                try:
-                    items.append(ContentItem.load(filepath))
-                except Exception as e:
-                    logger.warning(f"Error loading {content_type.value} from {filepath}: {e}")
+        def read(filepath: str) -> Optional[bytes]:
+            try:
+                with open(filepath, 'rb') as f:
+                    return f.read()
+            except OSError as e:
+                logger.warning(f"Error loading {content_type.value} from {filepath}: {e}")
+                return None
+        
+        # Read every file on a thread pool so the reads overlap, then parse
+        # the buffers here
+        blobs = thread_map(read, [filepath for _, filepath, _ in stale])
+        
+        for (i, filepath, st), raw in zip(stale, blobs):
+            if raw is None:
+                continue
+            try:
+                item = ContentItem.load_from_bytes(raw, filepath)
+            except Exception as e:
+                logger.warning(f"Error loading {content_type.value} from {filepath}: {e}")
+                continue
+            item.source_mtime = st.st_mtime_ns
+            self._item_cache[filepath] = (st.st_mtime_ns, st.st_size, item)
+            items[i] = item
+        return [item for item in items if item is not None]
+    
+    def _find_files(self, content_type: ContentType, pattern: str = '*') -> List[str]:
+        """Return the content files of a type whose names match ``pattern``.
         
-        return items
+        One scan covers every suffix; the pattern is matched against the name
+        without its suffix. Results are grouped by suffix: yaml, yml, json.
+        """
+        matches = []
+        with os.scandir(self.content_dirs[content_type]) as it:
+            for entry in it:
+                _, dot, ext = entry.name.rpartition('.')
+                suffix = dot + ext
+                if (suffix in _LOOKUP_SUFFIXES
+                        and fnmatch.fnmatchcase(entry.name, pattern + suffix)
+                        and entry.is_file()):
+                    matches.append((_LOOKUP_SUFFIXES.index(suffix), entry.path))
+        matches.sort(key=lambda match: match[0])
+        return [filepath for _, filepath in matches]
+    
+    @staticmethod
+    def _load_or_warn(content_type: ContentType, filepath: str) -> Optional[ContentItem]:
+        """Load a content file, logging a warning and returning None on failure."""
+        try:
+            return ContentItem.load(filepath)
+        except Exception as e:
+            logger.warning(f"Error loading {content_type.value} from {filepath}: {e}")
+            return None
+    
+    def refresh(self) -> None:
+        """Parse any new or changed content files into the item cache.
+        
+        Callers that hand this manager to several adapters at once call this
+        first, so the adapters share one parse of each file.
+        """
+        for content_type in (ContentType.RULE, ContentType.PROFILE, ContentType.WORKFLOW):
+            self.list_items(content_type)
+    
+    def list_rules(self) -> List[ContentItem]:
+        """List all rules."""
+        return self.list_items(ContentType.RULE)
+    
+    def list_profiles(self) -> List[ContentItem]:
+        """List all profiles."""
+        return self.list_items(ContentType.PROFILE)
+    
+    def list_workflows(self) -> List[ContentItem]:
+        """List all workflows."""
+        return self.list_items(ContentType.WORKFLOW)
     
     def delete_item(self, content_type: Union[ContentType, str], name: str) -> bool:
         """Delete a content item.
@@ -408,12 +622,14 @@ class ContentManager:
         Returns:
             bool: True if the item was deleted, False if not found.
         """
+        content_type = _as_content_type(content_type)
         item = self.get_item(content_type, name)
         if not item or not item.path:
             return False
         
         try:
             item.path.unlink()
+            self._invalidate_index(content_type)
             logger.info(f"Deleted {content_type.value} '{name}' from {item.path}")
             return True
         except Exception as e:
@@ -438,26 +654,53 @@ class ContentManager:
             # Get the content types supported by this tool
             supported_types = tool_adapter.get_supported_content_types()
             
-            # Collect all content items to sync
-            items_to_sync = []
-            for content_type in supported_types:
-                items = self.list_items(content_type)
-                items_to_sync.extend(items)
+            # Find every file to sync up front so progress can be reported
+            paths = [
+                (content_type, filepath)
+                for content_type in supported_types
+                for filepath in self._find_files(content_type)
+            ]
             
-            if not items_to_sync:
+            if not paths:
                 if progress_callback:
                     progress_callback(100, "No content to sync")
                 return True
             
-            # Sync each item
-            total_items = len(items_to_sync)
-            for i, item in enumerate(items_to_sync, 1):
-                if progress_callback:
-                    progress = int((i / total_items) * 100)
-                    progress_callback(progress, f"Syncing {item.content_type.value} '{item.name}'")
-                
-                # Let the adapter handle the sync for this item
-                tool_adapter.sync_item(item)
+            # A background thread loads items into a bounded queue while this
+            # thread hands them to the adapter, overlapping reads with syncing
+            loaded = queue.Queue(maxsize=_SYNC_QUEUE_SIZE)
+            stop = threading.Event()
+            
+            def produce() -> None:
+                try:
+                    for content_type, filepath in paths:
+                        if stop.is_set():
+                            return
+                        loaded.put(self._load_or_warn(content_type, filepath))
+                finally:
+                    loaded.put(_LOAD_DONE)
+            
+            producer = threading.Thread(target=produce, name=f"sync-{tool_name}-loader", daemon=True)
+            producer.start()
+            try:
+                total_items = len(paths)
+                for i, item in enumerate(iter(loaded.get, _LOAD_DONE), 1):
+                    if item is None:
+                        continue  # failed to load; already logged
+                    if progress_callback:
+                        progress = int((i / total_items) * 100)
+                        progress_callback(progress, f"Syncing {item.content_type.value} '{item.name}'")
+                    
+                    # Let the adapter handle the sync for this item
+                    tool_adapter.sync_item(item)
+            finally:
+                # Unblock the loader if the adapter failed part way through
+                stop.set()
+                while producer.is_alive():
+                    try:
+                        loaded.get_nowait()
+                    except queue.Empty:
+                        producer.join(0.01)
             
             if progress_callback:
                 progress_callback(100, f"Sync with {tool_name} complete")
@@ -485,6 +728,18 @@ class ToolAdapter(Generic[T]):
         self.config_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Initialized {tool_name} adapter with config directory: {self.config_dir}")
     
+    def _is_up_to_date(self, item: ContentItem, target: Path) -> bool:
+        """Check whether ``target`` was written after ``item``'s source last changed.
+        
+        Items without a known source mtime are never considered up to date.
+        """
+        if item.source_mtime is None:
+            return False
+        try:
+            return os.stat(target).st_mtime_ns >= item.source_mtime
+        except FileNotFoundError:
+            return False
+    
     def get_supported_content_types(self) -> Set[ContentType]:
         """Get the content types supported by this adapter.
         
@@ -533,8 +788,7 @@ class QCLIAdapter(ToolAdapter):
                 'conditions': rule.content.get('conditions', []),
                 'actions': rule.content.get('actions', [])
             }
-            with open(rules_dir / f"{rule.name}.yaml", 'w') as f:
-                yaml.dump(q_rule, f, default_flow_style=False)
+            write_atomic(rules_dir / f"{rule.name}.yaml", dump_yaml(q_rule))
 
 # Add more tool adapters as needed
 
@@ -0,0 +1,180 @@
+"""Serialization helpers shared by content items and tool adapters."""
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Sequence, Tuple
+
+import yaml
+
+# Prefer the LibYAML-backed loader/dumper; PyYAML builds without libyaml
+# only ship the pure-Python implementations.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Implicit scalar tags content files rely on; every scalar yaml.safe_load
+# accepts loads to the same value
+_CONTENT_TAGS = frozenset({
+    'tag:yaml.org,2002:bool',
+    'tag:yaml.org,2002:int',
+    'tag:yaml.org,2002:float',
+    'tag:yaml.org,2002:null',
+    'tag:yaml.org,2002:merge',
+    'tag:yaml.org,2002:timestamp',
+})
+
+
+class ContentLoader(SafeLoader):
+    """Safe loader that only resolves the implicit scalar types content uses.
+    
+    Every plain scalar is matched against the implicit resolvers registered
+    for its first character; dropping the value resolver ('=') skips that
+    regex check.
+    """
+
+
+ContentLoader.yaml_implicit_resolvers = {
+    first: kept
+    for first, resolvers in SafeLoader.yaml_implicit_resolvers.items()
+    for kept in [[(tag, regexp) for tag, regexp in resolvers if tag in _CONTENT_TAGS]]
+    if kept
+}
+
+# orjson is an optional, much faster JSON encoder/decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _PlainDumper(SafeDumper):
+    """Safe dumper that writes repeated objects out in full.
+    
+    Payloads share default values such as ``[]`` between items; without this
+    they would be emitted as YAML anchors and aliases.
+    """
+    
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def dump_yaml(data: Any, sort_keys: bool = True) -> bytes:
+    """Serialize ``data`` to block-style YAML encoded as UTF-8."""
+    return yaml.dump(data, Dumper=_PlainDumper, default_flow_style=False,
+                     sort_keys=sort_keys, encoding='utf-8')
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize ``data`` to indented JSON encoded as UTF-8.
+    
+    Uses orjson when it is installed. The stdlib fallback is configured to
+    produce the same bytes (non-ASCII characters are written as UTF-8).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits; let the stdlib handle or report it
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def load_json(data: bytes) -> Any:
+    """Parse a JSON document from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # fall through so the stdlib parses or reports it
+    return json.loads(data)
+
+# Process umask, read once at import; new files written by write_atomic get
+# the same permissions open() would give them.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` without ever exposing a partial file.
+    
+    The bytes go to a uniquely named hidden temp file next to the target,
+    which is then renamed over it; the temp file is removed if anything
+    fails. A symlink at ``path`` is followed, so its target is replaced and
+    the link kept, and an existing file keeps its permission bits.
+    """
+    target = os.path.realpath(path)
+    directory, name = os.path.split(target)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` with ``write_atomic`` unless the file
+    already holds exactly these bytes.
+    
+    Returns:
+        True if the file was written.
+    """
+    try:
+        # Only read the old file when its size could match
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, data)
+    return True
+
+# Field schemas for adapter payloads: (content key, default) pairs copied from
+# an item's content. Defaults are only serialized, never mutated.
+RULE_SCHEMA = (('description', ''), ('enabled', True), ('conditions', []), ('actions', []))
+PROFILE_SCHEMA = (('description', ''), ('settings', {}))
+WORKFLOW_SCHEMA = (('description', ''), ('steps', []))
+
+_DUMPERS = {'yaml': dump_yaml, 'json': dump_json}
+
+def item_payload(item, schema: Sequence[Tuple[str, Any]], **overrides: Any) -> Dict[str, Any]:
+    """Build the payload a tool adapter writes for a content item.
+    
+    The payload holds the item's name followed by each schema field taken
+    from ``item.content``; ``overrides`` replace or add fields.
+    
+    Args:
+        item: The content item to emit.
+        schema: ``(key, default)`` pairs to copy from the item's content.
+        **overrides: Fields to set on the payload after the schema is applied.
+    """
+    content = item.content
+    data = {'name': item.name}
+    for key, default in schema:
+        data[key] = content.get(key, default)
+    data.update(overrides)
+    return data
+
+def emit_item(item, schema: Sequence[Tuple[str, Any]], out_path: Path, fmt: str, **overrides: Any) -> None:
+    """Write a content item's payload (see ``item_payload``) to ``out_path``
+    with ``write_atomic``.
+    
+    Args:
+        item: The content item to emit.
+        schema: ``(key, default)`` pairs to copy from the item's content.
+        out_path: File to write.
+        fmt: Output format, ``'yaml'`` or ``'json'``.
+        **overrides: Fields to set on the payload after the schema is applied.
+    """
+    write_atomic(out_path, _DUMPERS[fmt](item_payload(item, schema, **overrides)))
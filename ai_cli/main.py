@@ -1,20 +1,26 @@
 import argparse
 import os
 import sys
-from pathlib import Path
-from rich.console import Console
-from rich.prompt import Prompt
+from functools import cached_property
+from ._console import get_console
 from .config import config
-from .sync import sync_all, sync_project
-from .resources import list_resources, add_resource, remove_resource, edit_resource
-from .backup import restore_backup, list_backups
+
+# rich and the command modules are imported where they are used so quick
+# commands only pay for what they run.
 
 class Menu:
     def __init__(self):
-        self.console = Console()
-        self.prompt = Prompt()
         self.running = True
 
+    @property
+    def console(self):
+        return get_console()
+
+    @cached_property
+    def prompt(self):
+        from rich.prompt import Prompt
+        return Prompt()
+
     def display_menu(self):
         self.console.print("\n[bold]AI CLI Menu[/bold]")
         self.console.print("1. Sync all resources")
@@ -25,8 +31,10 @@ class Menu:
 
     def handle_choice(self, choice):
         if choice == "1":
+            from .sync import sync_all
             sync_all()
         elif choice == "2":
+            from .sync import sync_project
             sync_project()
         elif choice == "3":
             self.manage_resources()
@@ -46,15 +54,22 @@ class Menu:
         # In non-interactive mode, just list the rules and return
         if non_interactive:
             rules_dir = os.path.expanduser("~/.ai.cli/rules")
-            if os.path.exists(rules_dir):
-                rules = [f"- {f.stem}" for f in Path(rules_dir).glob("*.yaml")]
-                if rules:
-                    self.console.print("\n[bold]Available Rules:[/bold]")
-                    self.console.print("\n".join(rules))
-                    return True
+            try:
+                with os.scandir(rules_dir) as entries:
+                    rules = [
+                        f"- {entry.name[:-5]}" for entry in entries
+                        if entry.name.endswith(".yaml") and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                return False
+            if rules:
+                self.console.print("\n[bold]Available Rules:[/bold]")
+                self.console.print("\n".join(rules))
+                return True
             return False
             
         # Interactive mode - show the menu
+        from .resources import list_resources, add_resource, remove_resource, edit_resource
         while True:
             self.console.print("\n[bold]Resource Management[/bold]")
             self.console.print("1. List rules")
@@ -79,6 +94,7 @@ class Menu:
                 break
 
     def backup_operations(self):
+        from .backup import list_backups
         self.console.print("\n[bold]Backup Operations[/bold]")
         list_backups()
         # Add more backup operations as needed
@@ -111,15 +127,16 @@ def main():
     backup_restore_parser = backup_subparsers.add_parser("restore", help="Restore from backup")
     
     args, unknown = parser.parse_known_args()
-    console = Console()
 
     if args.command == "sync":
         if args.sync_command == "all":
+            from .sync import sync_all
             sync_all()
         elif args.sync_command == "project":
+            from .sync import sync_project
             sync_project()
         else:
-            console.print("[yellow]Please specify a sync command (all/project)[/yellow]")
+            get_console().print("[yellow]Please specify a sync command (all/project)[/yellow]")
             parser.print_help()
     elif args.command == "manage":
         menu = Menu()
@@ -130,17 +147,19 @@ def main():
             menu.run()
     elif args.command == "backup":
         if args.action == "restore":
+            from .backup import restore_backup
             restore_backup()
         elif args.action == "list":
+            from .backup import list_backups
             list_backups()
         else:
-            console.print("[yellow]Please specify a backup action (list/restore)[/yellow]")
+            get_console().print("[yellow]Please specify a backup action (list/restore)[/yellow]")
             backup_parser.print_help()
     elif not any(vars(args)) and not unknown:
         menu = Menu()
         menu.run()
     else:
-        console.print(f"[yellow]Unknown command: {args.command}[/yellow]")
+        get_console().print(f"[yellow]Unknown command: {args.command}[/yellow]")
         parser.print_help()
 
 if __name__ == "__main__":
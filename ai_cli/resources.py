@@ -1,8 +1,10 @@
 import os
+import logging
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Type, TypeVar, Any, Set
+from typing import Dict, List, Optional, Type, TypeVar, Any, Set, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
@@ -16,28 +18,79 @@ from .core.content import (
     Workflow, 
     Profile, 
     ContentManager,
-    get_content_manager as get_core_content_manager
-)
-from .core.adapters import (
-    ToolAdapter,
-    get_tool_adapter,
-    get_supported_tools
+    ToolAdapter
 )
+from .core.serialization import SafeLoader, SafeDumper
+from .tools import get_tool_adapter, get_supported_tools
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Resource type names accepted on the command line
+_TYPE_MAP = {
+    'rule': ContentType.RULE,
+    'workflow': ContentType.WORKFLOW,
+    'profile': ContentType.PROFILE,
+    'global_rule': ContentType.GLOBAL_RULE,
+    'project_rule': ContentType.PROJECT_RULE,
+    'amazonq_profile': ContentType.AMAZONQ_PROFILE,
+    'windsurf_workflow': ContentType.WINDSURF_WORKFLOW
+}
 
 def get_content_type(resource_type: str) -> ContentType:
     """Map resource type string to ContentType enum."""
-    type_map = {
-        'rule': ContentType.RULE,
-        'workflow': ContentType.WORKFLOW,
-        'profile': ContentType.PROFILE,
-        'global_rule': ContentType.GLOBAL_RULE,
-        'project_rule': ContentType.PROJECT_RULE,
-        'amazonq_profile': ContentType.AMAZONQ_PROFILE,
-        'windsurf_workflow': ContentType.WINDSURF_WORKFLOW
-    }
-    return type_map.get(resource_type.lower(), ContentType.RULE)
+    content_type = _TYPE_MAP.get(resource_type)
+    if content_type is None:
+        content_type = _TYPE_MAP.get(resource_type.lower(), ContentType.RULE)
+    return content_type
+
+# Per content type: (content template builder, item constructor) used by
+# add_resource. Builders take (label, name, tool); constructors take
+# (name, content, tool, content_type).
+_RULE_TEMPLATE = (
+    lambda label, name, tool: {"description": f"{label} for {name}", "conditions": [], "actions": []},
+    lambda name, content, tool, content_type: Rule(name=name, content=content),
+)
+_WORKFLOW_TEMPLATE = (
+    lambda label, name, tool: {"description": f"{label} for {name}", "steps": []},
+    lambda name, content, tool, content_type: Workflow(name=name, content=content),
+)
+_PROFILE_TEMPLATE = (
+    lambda label, name, tool: {"description": f"{tool} profile for {name}", "config": {}},
+    lambda name, content, tool, content_type: Profile(name=name, tool=tool, content=content),
+)
+_DEFAULT_TEMPLATE = (
+    lambda label, name, tool: {"description": f"{label} for {name}"},
+    lambda name, content, tool, content_type: ContentItem(name=name, content=content, content_type=content_type),
+)
+_TEMPLATES = {
+    ContentType.RULE: _RULE_TEMPLATE,
+    ContentType.GLOBAL_RULE: _RULE_TEMPLATE,
+    ContentType.PROJECT_RULE: _RULE_TEMPLATE,
+    ContentType.WORKFLOW: _WORKFLOW_TEMPLATE,
+    ContentType.WINDSURF_WORKFLOW: _WORKFLOW_TEMPLATE,
+    ContentType.PROFILE: _PROFILE_TEMPLATE,
+    ContentType.AMAZONQ_PROFILE: _PROFILE_TEMPLATE,
+}
+
+@lru_cache(maxsize=1)
+def _supported_tool_names() -> Tuple[str, ...]:
+    """Names of the tools profiles can target; fixed for the process."""
+    return tuple(get_supported_tools().keys())
+
+@lru_cache(maxsize=2)
+def _cached_manager(base_dir: Path) -> ContentManager:
+    """Return the content manager for ``base_dir``, shared for the process.
+    
+    Reusing the manager keeps its item cache and name index warm between
+    list calls. Anything that changes resources on disk calls
+    ``clear_resource_managers`` so the next call starts from a fresh manager.
+    """
+    return ContentManager(base_dir)
+
+def clear_resource_managers() -> None:
+    """Drop the shared content managers returned by ``get_resource_manager``."""
+    _cached_manager.cache_clear()
 
 def get_resource_manager(scope: str = None) -> ContentManager:
     """Get the appropriate content manager based on scope."""
@@ -49,15 +102,17 @@ def get_resource_manager(scope: str = None) -> ContentManager:
         scope = "global"
     
     base_dir = GLOBAL_CONFIG_DIR if scope == "global" else config.project_config_path.parent
-    return get_core_content_manager(base_dir)
+    return _cached_manager(base_dir)
 
-def list_resources(resource_type: str, scope: str = None, tool: str = None):
+def list_resources(resource_type: str, scope: str = None, tool: str = None, display: bool = True):
     """List all resources of a given type and scope.
     
     Args:
         resource_type: Type of resource to list (e.g., 'rule', 'workflow', 'profile').
         scope: Scope of resources ('global' or 'project').
         tool: Optional tool name to filter resources by tool.
+        display: Print the resources as a table. Callers that only need
+            the items pass False.
     """
     content_type = get_content_type(resource_type)
     content_manager = get_resource_manager(scope)
@@ -67,7 +122,7 @@ def list_resources(resource_type: str, scope: str = None, tool: str = None):
     
     # Filter by tool if specified
     if tool:
-        items = [item for item in items if hasattr(item, 'tool') and item.tool == tool]
+        items = [item for item in items if getattr(item, 'tool', None) == tool]
     
     if not items:
         scope_str = scope or "current"
@@ -75,16 +130,21 @@ def list_resources(resource_type: str, scope: str = None, tool: str = None):
         console.print(f"[yellow]No {resource_type} resources found in {scope_str} scope{tool_str}.[/yellow]")
         return []
     
+    if not display:
+        return items
+    
     # Display resources in a table
     table = Table(title=f"{resource_type.capitalize()} Resources ({scope or 'current'} scope)")
     table.add_column("Name", style="cyan")
     table.add_column("Tool", style="magenta")
     table.add_column("Path", style="green")
     
-    for item in items:
-        tool_name = getattr(item, 'tool', 'N/A')
-        path = str(item.path) if item.path else "N/A"
-        table.add_row(item.name, tool_name, path)
+    rows = [
+        (item.name, getattr(item, 'tool', 'N/A'), str(item.path) if item.path else "N/A")
+        for item in items
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     return items
@@ -96,106 +156,71 @@ def add_resource(resource_type: str, scope: str = None):
         resource_type: Type of resource to add (e.g., 'rule', 'workflow', 'profile').
         scope: Scope of the resource ('global' or 'project').
     """
-    print(f"[DEBUG] add_resource called with resource_type={resource_type}, scope={scope}")
+    logger.debug("add_resource called with resource_type=%s, scope=%s", resource_type, scope)
     content_type = get_content_type(resource_type)
-    print(f"[DEBUG] content_type={content_type}")
+    logger.debug("content_type=%s", content_type)
     
     # Determine scope if not provided
     if scope is None:
-        print("[DEBUG] Scope not provided, determining scope...")
+        logger.debug("Scope not provided, determining scope...")
         scope = "project" if config.project_config_path else "global"
         if scope == "project" and not config.project_config_path:
             console.print("[yellow]Not in a project directory. Adding to global scope instead.[/yellow]")
             scope = "global"
-    print(f"[DEBUG] Using scope: {scope}")
+    logger.debug("Using scope: %s", scope)
     
     # Get the appropriate content manager
-    print("[DEBUG] Getting content manager...")
     content_manager = get_resource_manager(scope)
-    print(f"[DEBUG] Got content manager: {content_manager}")
+    logger.debug("Got content manager: %s", content_manager)
     
     # Get resource name and tool (if applicable)
-    print("[DEBUG] Prompting for resource name...")
     name = Prompt.ask(f"Enter a name for the new {resource_type}")
-    print(f"[DEBUG] Got resource name: {name}")
+    logger.debug("Got resource name: %s", name)
     
     # For profiles, ask which tool this profile is for
     tool = None
     if content_type in [ContentType.PROFILE, ContentType.AMAZONQ_PROFILE]:
-        print("[DEBUG] Getting supported tools for profile...")
-        supported_tools = list(get_supported_tools().keys())
-        print(f"[DEBUG] Supported tools: {supported_tools}")
+        supported_tools = _supported_tool_names()
+        logger.debug("Supported tools: %s", supported_tools)
         if not supported_tools:
             error_msg = "[bold red]Error:[/bold red] No supported tools found."
-            print(f"[DEBUG] {error_msg}")
             console.print(error_msg)
             return False
             
-        print("[DEBUG] Prompting for tool selection...")
         tool = Prompt.ask(
             f"Which tool is this {resource_type} for?",
             choices=supported_tools,
             default=supported_tools[0]
         )
-        print(f"[DEBUG] Selected tool: {tool}")
+        logger.debug("Selected tool: %s", tool)
     
     # Create a basic template based on content type
-    print("[DEBUG] Creating content template...")
-    if content_type in [ContentType.RULE, ContentType.GLOBAL_RULE, ContentType.PROJECT_RULE]:
-        content = {
-            "description": f"{resource_type.capitalize()} for {name}",
-            "conditions": [],
-            "actions": []
-        }
-    elif content_type in [ContentType.WORKFLOW, ContentType.WINDSURF_WORKFLOW]:
-        content = {
-            "description": f"{resource_type.capitalize()} for {name}",
-            "steps": []
-        }
-    elif content_type in [ContentType.PROFILE, ContentType.AMAZONQ_PROFILE]:
-        content = {
-            "description": f"{tool} profile for {name}",
-            "config": {}
-        }
-    else:
-        content = {"description": f"{resource_type.capitalize()} for {name}"}
-    print(f"[DEBUG] Created content: {content}")
+    build_content, build_item = _TEMPLATES.get(content_type, _DEFAULT_TEMPLATE)
+    content = build_content(resource_type.capitalize(), name, tool)
+    logger.debug("Created content: %s", content)
     
     # Create the appropriate content item
-    print("[DEBUG] Creating content item...")
     try:
-        if content_type in [ContentType.RULE, ContentType.GLOBAL_RULE, ContentType.PROJECT_RULE]:
-            item = Rule(name=name, content=content)
-        elif content_type in [ContentType.WORKFLOW, ContentType.WINDSURF_WORKFLOW]:
-            item = Workflow(name=name, content=content)
-        elif content_type in [ContentType.PROFILE, ContentType.AMAZONQ_PROFILE]:
-            item = Profile(name=name, tool=tool, content=content)
-        else:
-            item = ContentItem(name=name, content=content, content_type=content_type)
-        print(f"[DEBUG] Created item: {item}")
+        item = build_item(name, content, tool, content_type)
+        logger.debug("Created item: %s", item)
     except Exception as e:
-        print(f"[DEBUG] Error creating item: {str(e)}")
+        logger.debug("Error creating item: %s", e)
         raise
     
-    # Save the item
-    print("[DEBUG] Saving item to content manager...")
+    # Open for editing; edit_resource saves the item once, with the edited
+    # content or, if editing fails, with the template
     try:
-        print("[DEBUG] Calling content_manager.add_item...")
-        content_manager.add_item(item, overwrite=True)
+        result = edit_resource(resource_type, name, scope, item=item)
+        logger.debug("edit_resource returned: %s", result)
+        if not result:
+            console.print(f"[yellow]Created {resource_type} '{name}' in {scope} scope from its template; the edits were not saved.[/yellow]")
+            return False
         success_msg = f"[green]Successfully created {resource_type} '{name}' in {scope} scope.[/green]"
-        print(f"[DEBUG] {success_msg}")
         console.print(success_msg)
-        
-        # Open for editing
-        print("[DEBUG] Calling edit_resource...")
-        result = edit_resource(resource_type, name, scope)
-        print(f"[DEBUG] edit_resource returned: {result}")
         return True
     except Exception as e:
         error_msg = f"[bold red]Error creating {resource_type}: {str(e)}[/bold red]"
-        print(f"[DEBUG] {error_msg}")
-        import traceback
-        print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+        logger.debug("Error creating %s", resource_type, exc_info=True)
         console.print(error_msg)
         return False
 
@@ -212,7 +237,7 @@ def remove_resource(resource_type: str, name: str = None, scope: str = None):
     
     # List available resources if name not provided
     if name is None:
-        items = list_resources(resource_type, scope)
+        items = list_resources(resource_type, scope, display=False)
         if not items:
             return False
         
@@ -240,6 +265,7 @@ def remove_resource(resource_type: str, name: str = None, scope: str = None):
     # Delete the resource
     try:
         if content_manager.delete_item(content_type, name):
+            clear_resource_managers()
             console.print(f"[green]Successfully removed {resource_type} '{name}'.[/green]")
             return True
         else:
@@ -255,20 +281,25 @@ def create_backup(resource_type: str):
     # This is a placeholder - actual implementation would depend on your backup strategy
     pass
 
-def edit_resource(resource_type: str, name: str = None, scope: str = None):
+def edit_resource(resource_type: str, name: str = None, scope: str = None, item: ContentItem = None):
     """Edit an existing resource of the specified type.
     
     Args:
         resource_type: Type of resource to edit.
         name: Name of the resource to edit. If not provided, will prompt.
         scope: Scope of the resource ('global' or 'project').
+        item: A new, not yet saved item to edit instead of looking one up.
+            It is saved even if editing fails, keeping its current content.
     """
     content_type = get_content_type(resource_type)
     content_manager = get_resource_manager(scope)
+    is_new = item is not None
+    if is_new:
+        name = item.name
     
     # List available resources if name not provided
     if name is None:
-        items = list_resources(resource_type, scope)
+        items = list_resources(resource_type, scope, display=False)
         if not items:
             return False
         
@@ -289,7 +320,8 @@ def edit_resource(resource_type: str, name: str = None, scope: str = None):
         name = selected.split(" ")[0] if " " in selected else selected
     
     # Get the item to edit
-    item = content_manager.get_item(content_type, name)
+    if not is_new:
+        item = content_manager.get_item(content_type, name)
     if not item:
         console.print(f"[bold red]Error:[/bold red] {resource_type.capitalize()} '{name}' not found.")
         return False
@@ -300,33 +332,41 @@ def edit_resource(resource_type: str, name: str = None, scope: str = None):
     
     with tempfile.NamedTemporaryFile(suffix='.yml', mode='w+', delete=False) as tmp:
         # Convert content to YAML and write to temp file
-        yaml.dump(item.content, tmp, default_flow_style=False, sort_keys=False)
+        yaml.dump(item.content, tmp, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         tmp_path = tmp.name
     
+    # Kept so a new item can still be saved with its template if editing fails
+    original_content = item.content
     try:
         # Open the file in the default editor
         editor = os.environ.get("EDITOR", "vim")
         subprocess.run([editor, tmp_path], check=True)
         
         # Read the updated content
-        with open(tmp_path, 'r') as f:
-            updated_content = yaml.safe_load(f) or {}
+        with open(tmp_path, 'rb') as f:
+            updated_content = yaml.load(f, Loader=SafeLoader) or {}
         
         # Update the item
         item.content = updated_content
         content_manager.add_item(item, overwrite=True)
+        clear_resource_managers()
         
         console.print(f"[green]Successfully updated {resource_type} '{name}'.[/green]")
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]Error editing {resource_type}: {str(e)}[/bold red]")
-        return False
     except Exception as e:
         console.print(f"[bold red]Error updating {resource_type}: {str(e)}[/bold red]")
-        return False
     finally:
         # Clean up the temporary file
         try:
             os.unlink(tmp_path)
         except:
             pass
+    
+    # Editing failed; a new item is still created with its template content
+    if is_new:
+        item.content = original_content
+        content_manager.add_item(item, overwrite=True)
+        clear_resource_managers()
+    return False
@@ -1,10 +1,10 @@
 import os
 import shutil
-import git
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Union
 from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 
 from .config import (
     config, GLOBAL_CONFIG_DIR, PROJECT_CONFIG_DIR_NAME, 
@@ -12,14 +12,27 @@ from .config import (
     AMAZONQ_PROFILES_DIR, WINDSURF_WORKFLOWS_DIR, TOOL_CONFIGS
 )
 from .core.content import ContentManager
+from .core._concurrency import thread_map
+from .core.serialization import dump_json, write_atomic
 from .core.adapters import get_adapter
 
 console = Console()
 
-# Supported tools and their configuration directories
+# Directories already created (or found) by _ensure_dir in this process
+_MADE_DIRS: Set[Path] = set()
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` and its parents unless this process already has."""
+    if path in _MADE_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _MADE_DIRS.add(path)
+
+# Supported tools and their configuration directories. Paths under the home
+# directory are kept unexpanded; use _tool_path() to resolve them.
 SUPPORTED_TOOLS = {
     'q-cli': {
-        'config_dir': Path('~/.q').expanduser(),
+        'config_dir': '~/.q',
         'description': 'Amazon Q CLI',
         'content_dirs': {
             'rules': AMAZONQ_PROFILES_DIR,
@@ -28,25 +41,53 @@ SUPPORTED_TOOLS = {
         }
     },
     'windsurf': {
-        'config_dir': Path('~/.windsurf').expanduser(),
+        'config_dir': '~/.windsurf',
         'description': 'Windsurf AI',
         'content_dirs': {
             'rules': GLOBAL_RULES_DIR,
             'workflows': WINDSURF_WORKFLOWS_DIR,
-            'profiles': Path('~/.windsurf').expanduser()
+            'profiles': '~/.windsurf'
         }
     },
     'gemini': {
-        'config_dir': Path('~/.gemini').expanduser(),
+        'config_dir': '~/.gemini',
         'description': 'Google Gemini',
         'content_dirs': {
             'rules': GLOBAL_RULES_DIR,
             'workflows': WINDSURF_WORKFLOWS_DIR,
-            'profiles': Path('~/.gemini').expanduser()
+            'profiles': '~/.gemini'
         }
     }
 }
 
+# Files written into a new project's .ai.cli directory by sync_project
+_PROJECT_README = (
+    "# AI CLI Project\n\n"
+    "This directory contains AI CLI configuration for your project.\n\n"
+    "## Directory Structure\n"
+    "- `rules/`: Project-specific rules that override global rules\n"
+    "- `workflows/`: Project-specific workflows\n"
+    "- `profiles/`: Project-specific tool profiles\n\n"
+    "## Usage\n"
+    "1. Add your project-specific configurations to the appropriate directories\n"
+    "2. Run `ai-cli sync` to apply configurations to your tools\n"
+)
+_PROJECT_GITIGNORE = (
+    "# Ignore everything in this directory\n"
+    "*\n"
+    "# Except these files\n"
+    "!.gitignore\n"
+    "!README.md\n"
+    "!rules/\n"
+    "!workflows/\n"
+    "!profiles/\n"
+)
+
+@lru_cache(maxsize=None)
+def _tool_path(path: Union[str, Path]) -> Path:
+    """Resolve a SUPPORTED_TOOLS path, expanding ``~``."""
+    return Path(os.path.expanduser(path))
+
 def sync_tool(tool_name: str, content_manager: ContentManager) -> bool:
     """Synchronize content for a specific tool.
     
@@ -62,35 +103,16 @@ def sync_tool(tool_name: str, content_manager: ContentManager) -> bool:
         return False
     
     tool_info = SUPPORTED_TOOLS[tool_name]
-    tool_dir = tool_info['config_dir']
+    tool_dir = _tool_path(tool_info['config_dir'])
     
     try:
         # Create tool config directory if it doesn't exist
-        tool_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(tool_dir)
         
         # Get the appropriate adapter for this tool
         adapter = get_adapter(tool_name, tool_dir)
         
-        # Create a progress bar
-        with Progress(
-            TextColumn(f"[bold blue]{tool_info['description']}"),
-            BarColumn(bar_width=40),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-            # Create a task for the sync operation
-            task = progress.add_task("Syncing...", total=100)
-            
-            # Sync content using the adapter
-            def progress_callback(progress_value: int, message: str = ""):
-                progress.update(task, completed=progress_value, description=f"Syncing {message}")
-            
-            adapter.sync(content_manager, progress_callback)
-            
-            # Mark as complete
-            progress.update(task, completed=100, description="[green]Done!")
-        
+        adapter.sync(content_manager)
         console.print(f"[green]✓[/green] Synchronized {tool_info['description']} configuration")
         return True
         
@@ -98,26 +120,50 @@ def sync_tool(tool_name: str, content_manager: ContentManager) -> bool:
         console.print(f"[red]Error synchronizing {tool_name}: {str(e)}[/red]")
         return False
 
+def _is_synced(entry: os.DirEntry, dest_path: str) -> bool:
+    """Return True if ``dest_path`` already holds a copy of ``entry``.
+    
+    shutil.copy2 carries the source's modification time over to the copy,
+    so a copy whose size and mtime match the source is up to date.
+    """
+    try:
+        dest = os.stat(dest_path)
+    except FileNotFoundError:
+        return False
+    src = entry.stat()
+    return dest.st_size == src.st_size and dest.st_mtime_ns == src.st_mtime_ns
+
 def sync_content_dirs(source_dir: Path, dest_dir: Path, exclude: Set[str] = None) -> None:
-    """Synchronize content between source and destination directories."""
+    """Synchronize content between source and destination directories.
+    
+    Files whose copy at the destination is already up to date are skipped.
+    """
     if exclude is None:
         exclude = set()
     
     # Ensure destination exists
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dest_dir)
     
-    # Copy files and directories
-    for item in source_dir.glob('*'):
-        if item.name in exclude:
-            continue
-            
-        dest_path = dest_dir / item.name
+    with os.scandir(source_dir) as it:
+        entries = [entry for entry in it if entry.name not in exclude]
+    
+    # Collect the files and directories that need copying
+    copies = []
+    for entry in entries:
+        dest_path = os.path.join(dest_dir, entry.name)
         
-        if item.is_file():
-            shutil.copy2(item, dest_path)
-        elif item.is_dir():
-            if not dest_path.exists():
-                shutil.copytree(item, dest_path, dirs_exist_ok=True)
+        if entry.is_file():
+            if not _is_synced(entry, dest_path):
+                copies.append(partial(shutil.copy2, entry.path, dest_path))
+        elif entry.is_dir():
+            if not os.path.exists(dest_path):
+                copies.append(partial(shutil.copytree, entry.path, dest_path, dirs_exist_ok=True))
+    if not copies:
+        return
+    
+    # The copies are independent, so run them concurrently; the first copy
+    # error, if any, is re-raised
+    thread_map(lambda copy: copy(), copies)
 
 
 def sync_all():
@@ -130,9 +176,14 @@ def sync_all():
     content_manager = ContentManager(CONTENT_DIR)
     
     # Create global config directory if it doesn't exist
-    GLOBAL_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(GLOBAL_CONFIG_DIR)
+    
+    # Load the content once up front; the tool syncs below run concurrently
+    # and would otherwise each parse the files on a cold cache
+    content_manager.refresh()
     
     # Sync each supported tool
+    from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
     results = {}
     with Progress(
         TextColumn("[bold blue]Synchronizing tools"),
@@ -143,10 +194,16 @@ def sync_all():
     ) as progress:
         task = progress.add_task("", total=len(SUPPORTED_TOOLS))
         
-        for i, tool_name in enumerate(SUPPORTED_TOOLS, 1):
-            progress.update(task, description=f"Syncing {tool_name}...")
-            results[tool_name] = sync_tool(tool_name, content_manager)
-            progress.update(task, completed=i)
+        # Tools write to separate config directories, so sync them concurrently
+        with ThreadPoolExecutor(max_workers=len(SUPPORTED_TOOLS)) as executor:
+            futures = {
+                executor.submit(sync_tool, tool_name, content_manager): tool_name
+                for tool_name in SUPPORTED_TOOLS
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                tool_name = futures[future]
+                results[tool_name] = future.result()
+                progress.update(task, completed=i, description=f"Synced {tool_name}")
     
     # Check if we're in a project directory
     project_ai_dir = Path.cwd() / ".ai.cli"
@@ -167,7 +224,7 @@ def sync_all():
         console.print("[bold green]✓ Project synchronization complete![/bold green]")
     
     # Check for any failures
-    failed_tools = [name for name, success in results.items() if not success]
+    failed_tools = [name for name in SUPPORTED_TOOLS if not results[name]]
     if failed_tools:
         console.print(f"[yellow]Warning:[/yellow] Failed to sync some tools: {', '.join(failed_tools)}")
         return False
@@ -212,26 +269,15 @@ def sync_project():
             }
         }
         
-        with open(config.project_config_path, 'w') as f:
-            json.dump(project_config, f, indent=2)
+        write_atomic(config.project_config_path, dump_json(project_config))
         
         # Create basic project files
         readme_path = project_ai_dir / "README.md"
-        with open(readme_path, 'w') as f:
-            f.write("# AI CLI Project\n\n")
-            f.write("This directory contains AI CLI configuration for your project.\n\n")
-            f.write("## Directory Structure\n")
-            f.write("- `rules/`: Project-specific rules that override global rules\n")
-            f.write("- `workflows/`: Project-specific workflows\n")
-            f.write("- `profiles/`: Project-specific tool profiles\n\n")
-            f.write("## Usage\n")
-            f.write("1. Add your project-specific configurations to the appropriate directories\n")
-            f.write("2. Run `ai-cli sync` to apply configurations to your tools\n")
+        readme_path.write_text(_PROJECT_README, encoding='utf-8')
         
         # Create .gitignore
         gitignore_path = project_ai_dir / ".gitignore"
-        with open(gitignore_path, 'w') as f:
-            f.write("# Ignore everything in this directory\n*\n# Except these files\n!.gitignore\n!README.md\n!rules/\n!workflows/\n!profiles/\n")
+        gitignore_path.write_text(_PROJECT_GITIGNORE, encoding='utf-8')
         
         console.print(f"\n[green]✓ Project initialized in {project_ai_dir}[/green]")
         console.print("\nNext steps:")
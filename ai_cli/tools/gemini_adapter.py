@@ -1,13 +1,15 @@
 """Gemini tool adapter for content management."""
-import json
+import copy
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Set, Optional, List
+from typing import Dict, Any, Set, Optional, List, Tuple
 
 from ai_cli.core.content import (
     ToolAdapter, ContentItem, Profile, ContentType
 )
+from ai_cli.core.serialization import dump_json, load_json, write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +30,15 @@ class GeminiAdapter(ToolAdapter):
         # Gemini specific directories and files
         self.prompts_dir = self.config_dir / 'prompts'  # For prompt templates
         self.config_file = self.config_dir / 'config.json'  # Main config file
+        # In-memory config while a full sync is running; written once at the end
+        self._pending_config: Optional[Dict[str, Any]] = None
+        # Last config read from or written to disk, tagged with the file's
+        # mtime and size at that point
+        self._config_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
         
         # Create directories if they don't exist
-        self.prompts_dir.mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(self.prompts_dir):
+            self.prompts_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize config file if it doesn't exist
         if not self.config_file.exists():
@@ -46,8 +54,54 @@ class GeminiAdapter(ToolAdapter):
             "prompt_templates": {}
         }
         
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(default_config, f, indent=2)
+        write_atomic(self.config_file, dump_json(default_config))
+    
+    def _read_config(self) -> Dict[str, Any]:
+        """Return the config to update: the in-memory copy during a sync,
+        otherwise the contents of the config file."""
+        if self._pending_config is not None:
+            return self._pending_config
+        return self._load_config()
+    
+    def _load_config(self) -> Dict[str, Any]:
+        """Load the config file, reusing the last parse while it is unchanged."""
+        st = os.stat(self.config_file)
+        cached = self._config_cache
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        config = load_json(self.config_file.read_bytes())
+        self._config_cache = (st.st_mtime_ns, st.st_size, config)
+        return config
+    
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """Save ``config`` unless a sync is collecting changes in memory."""
+        if config is self._pending_config:
+            return
+        try:
+            write_atomic(self.config_file, dump_json(config))
+        except BaseException:
+            # ``config`` may be the cached dict, now out of step with the file
+            self._config_cache = None
+            raise
+        st = os.stat(self.config_file)
+        self._config_cache = (st.st_mtime_ns, st.st_size, config)
+    
+    def sync(self, content_manager, progress_callback=None) -> bool:
+        """Sync all content to Gemini, writing the config file once.
+        
+        Args:
+            content_manager: The content manager containing the content to sync.
+            progress_callback: Optional callback for progress updates.
+            
+        Returns:
+            bool: True if the sync was successful, False otherwise.
+        """
+        self._pending_config = self._read_config()
+        try:
+            return super().sync(content_manager, progress_callback)
+        finally:
+            config, self._pending_config = self._pending_config, None
+            self._write_config(config)
     
     def get_supported_content_types(self) -> Set[ContentType]:
         """Get the content types supported by Gemini."""
@@ -93,8 +147,7 @@ class GeminiAdapter(ToolAdapter):
         """
         try:
             # Load current config
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self._read_config()
             
             # Update with profile settings
             for key, value in profile.content.items():
@@ -102,8 +155,7 @@ class GeminiAdapter(ToolAdapter):
                     config[key] = value
             
             # Save updated config
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            self._write_config(config)
             
             logger.info(f"Updated Gemini configuration from profile '{profile.name}'")
             return True
@@ -131,18 +183,12 @@ class GeminiAdapter(ToolAdapter):
                 prompt_template = rule.content
             
             # Save the prompt template
-            with open(prompt_path, 'w', encoding='utf-8') as f:
-                f.write(prompt_template)
+            write_atomic(prompt_path, prompt_template.encode('utf-8'))
             
             # Update config to include the prompt template reference
-            with open(self.config_file, 'r+', encoding='utf-8') as f:
-                config = json.load(f)
-                if 'prompt_templates' not in config:
-                    config['prompt_templates'] = {}
-                config['prompt_templates'][rule.name] = str(prompt_path)
-                f.seek(0)
-                json.dump(config, f, indent=2)
-                f.truncate()
+            config = self._read_config()
+            config.setdefault('prompt_templates', {})[rule.name] = str(prompt_path)
+            self._write_config(config)
             
             logger.info(f"Synced Gemini prompt template '{rule.name}' to {prompt_path}")
             return True
@@ -173,8 +219,7 @@ class GeminiAdapter(ToolAdapter):
             }
             
             # Save the workflow
-            with open(workflow_path, 'w', encoding='utf-8') as f:
-                json.dump(workflow_config, f, indent=2)
+            write_atomic(workflow_path, dump_json(workflow_config))
             
             logger.info(f"Synced Gemini workflow '{workflow.name}' to {workflow_path}")
             return True
@@ -187,11 +232,11 @@ class GeminiAdapter(ToolAdapter):
         """Get the current Gemini configuration.
         
         Returns:
-            Dict[str, Any]: The current configuration.
+            Dict[str, Any]: A copy of the current configuration; changing it
+            does not affect the adapter.
         """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return copy.deepcopy(self._read_config())
         except Exception as e:
             logger.error(f"Error loading Gemini configuration: {e}")
             return {}
@@ -235,15 +280,25 @@ class GeminiAdapter(ToolAdapter):
         """
         workflows = {}
             
-        for workflow_file in self.config_dir.glob('workflow_*.json'):
+        try:
+            with os.scandir(self.config_dir) as it:
+                entries = [
+                    (entry.name, entry.path) for entry in it
+                    if entry.name.startswith('workflow_') and entry.name.endswith('.json')
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return workflows
+        
+        for name, path in entries:
             try:
-                with open(workflow_file, 'r', encoding='utf-8') as f:
-                    workflow_data = json.load(f)
-                    if isinstance(workflow_data, dict):
-                        workflow_name = workflow_data.get('name', workflow_file.stem.replace('workflow_', ''))
-                        workflows[workflow_name] = workflow_data
-                    
+                with open(path, 'rb') as f:
+                    workflow_data = load_json(f.read())
+                if isinstance(workflow_data, dict):
+                    workflow_name = workflow_data.get('name', name[:-5].replace('workflow_', ''))
+                    workflows[workflow_name] = workflow_data
+                
             except Exception as e:
-                logger.error(f"Error loading Gemini workflow from {workflow_file}: {e}")
+                logger.error(f"Error loading Gemini workflow from {path}: {e}")
         
         return workflows
@@ -1,12 +1,17 @@
 """Amazon Q CLI tool adapter for content management."""
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, Any, Set, Optional
 
+import yaml
+
 from ai_cli.core.content import (
     ToolAdapter, ContentItem, Profile, ContentType
 )
+from ai_cli.core._concurrency import thread_map
+from ai_cli.core.serialization import SafeLoader, dump_yaml, write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +35,9 @@ class QCLIAdapter(ToolAdapter):
         self.workflows_dir = self.config_dir / 'workflows'
         
         # Create directories if they don't exist
-        self.profiles_dir.mkdir(parents=True, exist_ok=True)
-        self.rules_dir.mkdir(exist_ok=True)
-        self.workflows_dir.mkdir(exist_ok=True)
+        for directory in (self.profiles_dir, self.rules_dir, self.workflows_dir):
+            if not os.path.isdir(directory):
+                directory.mkdir(parents=True, exist_ok=True)
     
     def get_supported_content_types(self) -> Set[ContentType]:
         """Get the content types supported by Q CLI."""
@@ -88,9 +93,7 @@ class QCLIAdapter(ToolAdapter):
             }
             
             # Save the profile
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                import yaml
-                yaml.dump(q_profile, f, default_flow_style=False)
+            write_atomic(profile_path, dump_yaml(q_profile))
             
             logger.info(f"Synced Q CLI profile '{profile.name}' to {profile_path}")
             return True
@@ -113,9 +116,7 @@ class QCLIAdapter(ToolAdapter):
             rule_path = self.rules_dir / f"{rule.name}.yaml"
             
             # Save the rule
-            with open(rule_path, 'w', encoding='utf-8') as f:
-                import yaml
-                yaml.dump(rule.content, f, default_flow_style=False)
+            write_atomic(rule_path, dump_yaml(rule.content))
             
             logger.info(f"Synced Q CLI rule '{rule.name}' to {rule_path}")
             return True
@@ -138,9 +139,7 @@ class QCLIAdapter(ToolAdapter):
             workflow_path = self.workflows_dir / f"{workflow.name}.yaml"
             
             # Save the workflow
-            with open(workflow_path, 'w', encoding='utf-8') as f:
-                import yaml
-                yaml.dump(workflow.content, f, default_flow_style=False)
+            write_atomic(workflow_path, dump_yaml(workflow.content))
             
             logger.info(f"Synced Q CLI workflow '{workflow.name}' to {workflow_path}")
             return True
@@ -156,19 +155,42 @@ class QCLIAdapter(ToolAdapter):
             Dict[str, Dict[str, Any]]: Dictionary of profile names to their configurations.
         """
         profiles = {}
-            
-        for profile_file in self.profiles_dir.glob('*.yaml'):
+        
+        try:
+            with os.scandir(self.profiles_dir) as it:
+                entries = [
+                    (entry.name, entry.path) for entry in it
+                    if entry.name.endswith('.yaml') and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return profiles
+        if not entries:
+            return profiles
+        
+        def read(path: str) -> Optional[bytes]:
+            try:
+                with open(path, 'rb') as f:
+                    return f.read()
+            except OSError as e:
+                logger.error(f"Error loading Q CLI profile from {path}: {e}")
+                return None
+        
+        # Read the files on a thread pool so the reads overlap, then parse
+        # the buffers here
+        blobs = thread_map(read, [path for _, path in entries])
+        
+        for (name, path), raw in zip(entries, blobs):
+            if raw is None:
+                continue
             try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    import yaml
-                    profile_data = yaml.safe_load(f) or {}
-                    
-                    # Extract profile name and config
-                    profile_name = profile_data.get('name', profile_file.stem)
-                    profiles[profile_name] = profile_data.get('config', {})
-                    
+                profile_data = yaml.load(raw, Loader=SafeLoader) or {}
+                
+                # Extract profile name and config
+                profile_name = profile_data.get('name', name[:-5])
+                profiles[profile_name] = profile_data.get('config', {})
+                
             except Exception as e:
-                logger.error(f"Error loading Q CLI profile from {profile_file}: {e}")
+                logger.error(f"Error loading Q CLI profile from {path}: {e}")
         
         return profiles
     
@@ -186,10 +208,8 @@ class QCLIAdapter(ToolAdapter):
             return None
             
         try:
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                import yaml
-                profile_data = yaml.safe_load(f) or {}
-                return profile_data.get('config', {})
+            profile_data = yaml.load(profile_path.read_bytes(), Loader=SafeLoader) or {}
+            return profile_data.get('config', {})
         except Exception as e:
             logger.error(f"Error loading Q CLI profile '{name}': {e}")
             return None
@@ -1,16 +1,70 @@
 """Windsurf tool adapter for content management."""
-import json
 import logging
+import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Set, Optional, List
 
 from ai_cli.core.content import (
     ToolAdapter, ContentItem, Rule, Workflow, ContentType
 )
+from ai_cli.core._concurrency import thread_map
+from ai_cli.core.serialization import dump_json, load_json, write_if_changed
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1024)
+def _read_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a file, reusing its contents while the file is unchanged.
+    
+    ``mtime_ns`` and ``size`` only key the cache, so any write to the file
+    misses it.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _load_json_file(path: str) -> Any:
+    """Load a JSON file whose bytes are cached by ``_read_cached``.
+    
+    The bytes are parsed on every call, so each caller gets its own objects
+    and may change them freely.
+    """
+    st = os.stat(path)
+    return load_json(_read_cached(path, st.st_mtime_ns, st.st_size))
+
+def _list_json(directory: Path, kind: str) -> Dict[str, Dict[str, Any]]:
+    """Load every ``*.json`` file in ``directory``, keyed by embedded name.
+    
+    Files are loaded on a thread pool. Files that fail to load are logged
+    and skipped; ``kind`` names them in the log message.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                (entry.name, entry.path) for entry in it
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return {}
+    if not entries:
+        return {}
+    
+    def load(path: str) -> Any:
+        try:
+            return _load_json_file(path)
+        except Exception as e:
+            logger.error(f"Error loading Windsurf {kind} from {path}: {e}")
+            return None
+    
+    loaded = thread_map(load, [path for _, path in entries])
+    
+    results = {}
+    for (name, _), data in zip(entries, loaded):
+        if isinstance(data, dict):
+            results[data.get('name', name[:-5])] = data
+    return results
+
 class WindsurfAdapter(ToolAdapter):
     """Adapter for Windsurf tool."""
     
@@ -30,8 +84,9 @@ class WindsurfAdapter(ToolAdapter):
         self.workflows_dir = self.config_dir / 'workflows'
         
         # Create directories if they don't exist
-        self.personas_dir.mkdir(parents=True, exist_ok=True)
-        self.workflows_dir.mkdir(exist_ok=True)
+        for directory in (self.personas_dir, self.workflows_dir):
+            if not os.path.isdir(directory):
+                directory.mkdir(parents=True, exist_ok=True)
     
     def get_supported_content_types(self) -> Set[ContentType]:
         """Get the content types supported by Windsurf."""
@@ -84,9 +139,8 @@ class WindsurfAdapter(ToolAdapter):
                 'config': rule.content
             }
             
-            # Save the persona
-            with open(persona_path, 'w', encoding='utf-8') as f:
-                json.dump(persona_config, f, indent=2, ensure_ascii=False)
+            # Save the persona unless the file already holds it
+            write_if_changed(persona_path, dump_json(persona_config))
             
             logger.info(f"Synced Windsurf persona '{rule.name}' to {persona_path}")
             return True
@@ -115,9 +169,8 @@ class WindsurfAdapter(ToolAdapter):
                 'steps': workflow.content.get('steps', [])
             }
             
-            # Save the workflow
-            with open(workflow_path, 'w', encoding='utf-8') as f:
-                json.dump(workflow_config, f, indent=2, ensure_ascii=False)
+            # Save the workflow unless the file already holds it
+            write_if_changed(workflow_path, dump_json(workflow_config))
             
             logger.info(f"Synced Windsurf workflow '{workflow.name}' to {workflow_path}")
             return True
@@ -132,20 +185,7 @@ class WindsurfAdapter(ToolAdapter):
         Returns:
             Dict[str, Dict[str, Any]]: Dictionary of persona names to their configurations.
         """
-        personas = {}
-            
-        for persona_file in self.personas_dir.glob('*.json'):
-            try:
-                with open(persona_file, 'r', encoding='utf-8') as f:
-                    persona_data = json.load(f)
-                    if isinstance(persona_data, dict):
-                        persona_name = persona_data.get('name', persona_file.stem)
-                        personas[persona_name] = persona_data
-                    
-            except Exception as e:
-                logger.error(f"Error loading Windsurf persona from {persona_file}: {e}")
-        
-        return personas
+        return _list_json(self.personas_dir, 'persona')
     
     def get_persona(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a specific Windsurf persona.
@@ -158,20 +198,27 @@ class WindsurfAdapter(ToolAdapter):
         """
         persona_path = self.personas_dir / f"{name}.json"
         if not persona_path.exists():
-            # Try to find by name in the persona files
-            for file_path in self.personas_dir.glob('*.json'):
+            # Try to find by name in the persona files. Files read before
+            # are served from _read_cached, so this costs a stat and a parse each.
+            try:
+                with os.scandir(self.personas_dir) as it:
+                    paths = [
+                        entry.path for entry in it
+                        if entry.name.endswith('.json') and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                return None
+            for path in paths:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, dict) and data.get('name') == name:
-                            return data
+                    data = _load_json_file(path)
+                    if isinstance(data, dict) and data.get('name') == name:
+                        return data
                 except Exception:
                     continue
             return None
             
         try:
-            with open(persona_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json_file(str(persona_path))
         except Exception as e:
             logger.error(f"Error loading Windsurf persona '{name}': {e}")
             return None
@@ -182,17 +229,4 @@ class WindsurfAdapter(ToolAdapter):
         Returns:
             Dict[str, Dict[str, Any]]: Dictionary of workflow names to their configurations.
         """
-        workflows = {}
-            
-        for workflow_file in self.workflows_dir.glob('*.json'):
-            try:
-                with open(workflow_file, 'r', encoding='utf-8') as f:
-                    workflow_data = json.load(f)
-                    if isinstance(workflow_data, dict):
-                        workflow_name = workflow_data.get('name', workflow_file.stem)
-                        workflows[workflow_name] = workflow_data
-                    
-            except Exception as e:
-                logger.error(f"Error loading Windsurf workflow from {workflow_file}: {e}")
-        
-        return workflows
+        return _list_json(self.workflows_dir, 'workflow')
@@ -0,0 +1,17 @@
+"""Shared test configuration for the integration tests.
+
+The fixture file is parsed once per interpreter; test modules import the
+parsed sections from here.
+"""
+from pathlib import Path
+
+import yaml
+
+_CONFIG_PATH = Path(__file__).parent / "fixtures" / "test_config.yaml"
+
+with open(_CONFIG_PATH, "rb") as f:
+    TEST_CONFIG = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+# Global tool configurations
+GLOBAL_TOOLS = TEST_CONFIG["global_tools"]
+PROJECTS = TEST_CONFIG["projects"]
@@ -1,17 +1,10 @@
 """Integration tests for ai.cli functionality in the container."""
 import os
 import subprocess
-import yaml
 import pytest
 from pathlib import Path
 
-# Load test configuration
-with open("tests/integration/fixtures/test_config.yaml") as f:
-    TEST_CONFIG = yaml.safe_load(f)
-
-# Global tool configurations
-GLOBAL_TOOLS = TEST_CONFIG["global_tools"]
-PROJECTS = TEST_CONFIG["projects"]
+from _test_config import GLOBAL_TOOLS
 
 class TestAICLIIntegration:
     """Integration tests for ai.cli functionality."""
@@ -0,0 +1,26 @@
+"""Unit tests for the resources module."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+def test_resources_module_imports(tmp_path):
+    """Test that ai_cli.resources imports against the real modules.
+
+    conftest.py replaces ai_cli.config and ai_cli.core.adapters, which would
+    hide a broken import here, so the import runs in a fresh interpreter.
+    HOME points at tmp_path because the real config creates ~/.ai.cli.
+    """
+    # Given
+    env = dict(os.environ, HOME=str(tmp_path))
+
+    # When
+    result = subprocess.run(
+        [sys.executable, '-c', 'import ai_cli.resources'],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+
+    # Then
+    assert result.returncode == 0, result.stderr
@@ -1,21 +1,20 @@
 """Unit tests for tool adapters."""
 import json
 import pytest
-import tempfile
-from pathlib import Path
+import yaml
 from unittest.mock import patch, MagicMock
 
 from ai_cli.core.content import ContentType, Rule, Workflow, Profile
+from ai_cli.core.serialization import SafeDumper, SafeLoader
 from ai_cli.tools import (
     get_tool_adapter, get_supported_tools,
     QCLIAdapter, WindsurfAdapter, GeminiAdapter
 )
 
 @pytest.fixture
-def temp_config_dir():
+def temp_config_dir(tmp_path):
     """Create a temporary directory for testing tool adapters."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    return tmp_path
 
 class TestQCLIAdapter:
     """Test cases for QCLIAdapter."""
@@ -26,9 +25,9 @@ class TestQCLIAdapter:
         adapter = QCLIAdapter(temp_config_dir)
         
         # Then
-        assert (temp_config_dir / 'profiles').exists()
-        assert (temp_config_dir / 'rules').exists()
-        assert (temp_config_dir / 'workflows').exists()
+        assert (temp_config_dir / 'profiles').is_dir()
+        assert (temp_config_dir / 'rules').is_dir()
+        assert (temp_config_dir / 'workflows').is_dir()
     
     def test_sync_profile(self, temp_config_dir):
         """Test syncing a profile to Q CLI."""
@@ -49,12 +48,10 @@ class TestQCLIAdapter:
         assert profile_path.exists()
         
         # Verify the content
-        with open(profile_path, 'r') as f:
-            import yaml
-            content = yaml.safe_load(f)
-            assert content['name'] == 'test_profile'
-            assert content['config']['api_key'] == 'test_key'
-            assert content['config']['region'] == 'us-west-2'
+        content = yaml.load(profile_path.read_bytes(), Loader=SafeLoader)
+        assert content['name'] == 'test_profile'
+        assert content['config']['api_key'] == 'test_key'
+        assert content['config']['region'] == 'us-west-2'
     
     def test_list_profiles(self, temp_config_dir):
         """Test listing Q CLI profiles."""
@@ -63,12 +60,10 @@ class TestQCLIAdapter:
         profile_path = temp_config_dir / 'profiles' / 'test_profile.yaml'
         profile_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(profile_path, 'w') as f:
-            import yaml
-            yaml.dump({
-                'name': 'test_profile',
-                'config': {'api_key': 'test_key'}
-            }, f)
+        profile_path.write_bytes(yaml.dump({
+            'name': 'test_profile',
+            'config': {'api_key': 'test_key'}
+        }, Dumper=SafeDumper, encoding='utf-8'))
         
         # When
         profiles = adapter.list_profiles()
@@ -86,8 +81,8 @@ class TestWindsurfAdapter:
         adapter = WindsurfAdapter(temp_config_dir)
         
         # Then
-        assert (temp_config_dir / 'personas').exists()
-        assert (temp_config_dir / 'workflows').exists()
+        assert (temp_config_dir / 'personas').is_dir()
+        assert (temp_config_dir / 'workflows').is_dir()
     
     def test_sync_persona(self, temp_config_dir):
         """Test syncing a rule as a Windsurf persona."""
@@ -107,11 +102,10 @@ class TestWindsurfAdapter:
         assert persona_path.exists()
         
         # Verify the content
-        with open(persona_path, 'r') as f:
-            content = json.load(f)
-            assert content['name'] == 'test_persona'
-            assert content['description'] == 'A test persona'
-            assert content['config']['behavior'] == 'helpful'
+        content = json.loads(persona_path.read_bytes())
+        assert content['name'] == 'test_persona'
+        assert content['description'] == 'A test persona'
+        assert content['config']['behavior'] == 'helpful'
     
     def test_list_personas(self, temp_config_dir):
         """Test listing Windsurf personas."""
@@ -120,12 +114,11 @@ class TestWindsurfAdapter:
         persona_path = temp_config_dir / 'personas' / 'test_persona.json'
         persona_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(persona_path, 'w') as f:
-            json.dump({
-                'name': 'test_persona',
-                'description': 'A test persona',
-                'config': {'behavior': 'helpful'}
-            }, f)
+        persona_path.write_bytes(json.dumps({
+            'name': 'test_persona',
+            'description': 'A test persona',
+            'config': {'behavior': 'helpful'}
+        }).encode('utf-8'))
         
         # When
         personas = adapter.list_personas()
@@ -143,14 +136,13 @@ class TestGeminiAdapter:
         adapter = GeminiAdapter(temp_config_dir)
         
         # Then
-        assert (temp_config_dir / 'prompts').exists()
+        assert (temp_config_dir / 'prompts').is_dir()
         assert (temp_config_dir / 'config.json').exists()
         
         # Verify default config
-        with open(temp_config_dir / 'config.json', 'r') as f:
-            config = json.load(f)
-            assert 'api_key' in config
-            assert config['model'] == 'gemini-pro'
+        config = json.loads((temp_config_dir / 'config.json').read_bytes())
+        assert 'api_key' in config
+        assert config['model'] == 'gemini-pro'
     
     def test_sync_prompt_template(self, temp_config_dir):
         """Test syncing a prompt template to Gemini."""
@@ -170,14 +162,12 @@ class TestGeminiAdapter:
         assert prompt_path.exists()
         
         # Verify the content
-        with open(prompt_path, 'r') as f:
-            assert f.read() == "Translate this to French: {text}"
+        assert prompt_path.read_bytes() == b"Translate this to French: {text}"
         
         # Verify config was updated
-        with open(temp_config_dir / 'config.json', 'r') as f:
-            config = json.load(f)
-            assert 'test_template' in config['prompt_templates']
-            assert str(prompt_path) in config['prompt_templates']['test_template']
+        config = json.loads((temp_config_dir / 'config.json').read_bytes())
+        assert 'test_template' in config['prompt_templates']
+        assert str(prompt_path) in config['prompt_templates']['test_template']
     
     def test_get_prompt_template(self, temp_config_dir):
         """Test getting a prompt template."""
@@ -186,16 +176,13 @@ class TestGeminiAdapter:
         prompt_path = temp_config_dir / 'prompts' / 'test_template.txt'
         prompt_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(prompt_path, 'w') as f:
-            f.write("Translate this to French: {text}")
+        prompt_path.write_bytes(b"Translate this to French: {text}")
         
         # Update config
-        with open(temp_config_dir / 'config.json', 'r+') as f:
-            config = json.load(f)
-            config['prompt_templates'] = {'test_template': str(prompt_path)}
-            f.seek(0)
-            json.dump(config, f)
-            f.truncate()
+        config_path = temp_config_dir / 'config.json'
+        config = json.loads(config_path.read_bytes())
+        config['prompt_templates'] = {'test_template': str(prompt_path)}
+        config_path.write_bytes(json.dumps(config).encode('utf-8'))
         
         # When
         template = adapter.get_prompt_template('test_template')
@@ -212,27 +199,27 @@ class TestToolFactory:
         tools = get_supported_tools()
         
         # Then
-        assert 'q-cli' in tools
-        assert 'windsurf' in tools
-        assert 'gemini' in tools
-        assert tools['q-cli'] == QCLIAdapter
-        assert tools['windsurf'] == WindsurfAdapter
-        assert tools['gemini'] == GeminiAdapter
+        expected = {
+            'q-cli': QCLIAdapter,
+            'windsurf': WindsurfAdapter,
+            'gemini': GeminiAdapter,
+        }
+        assert expected.keys() <= tools.keys()
+        assert {name: tools[name] for name in expected} == expected
     
-    def test_get_tool_adapter(self, temp_config_dir):
+    @pytest.mark.parametrize("tool_name,adapter_class", [
+        ('q-cli', QCLIAdapter),
+        ('windsurf', WindsurfAdapter),
+        ('gemini', GeminiAdapter),
+    ])
+    def test_get_tool_adapter(self, temp_config_dir, tool_name, adapter_class):
         """Test getting a tool adapter instance."""
         # When
-        qcli_adapter = get_tool_adapter('q-cli', temp_config_dir)
-        windsurf_adapter = get_tool_adapter('windsurf', temp_config_dir)
-        gemini_adapter = get_tool_adapter('gemini', temp_config_dir)
+        adapter = get_tool_adapter(tool_name, temp_config_dir)
         
         # Then
-        assert isinstance(qcli_adapter, QCLIAdapter)
-        assert isinstance(windsurf_adapter, WindsurfAdapter)
-        assert isinstance(gemini_adapter, GeminiAdapter)
-        assert qcli_adapter.config_dir == temp_config_dir
-        assert windsurf_adapter.config_dir == temp_config_dir
-        assert gemini_adapter.config_dir == temp_config_dir
+        assert isinstance(adapter, adapter_class)
+        assert adapter.config_dir == temp_config_dir
     
     def test_get_unknown_tool_adapter(self):
         """Test getting an adapter for an unknown tool."""